@@ -3,10 +3,12 @@ FastAPI web application for X-Ray dashboard.
 Provides API endpoints for the React frontend.
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 from pathlib import Path
+import asyncio
 import sys
 import json
 import tempfile
@@ -21,14 +23,76 @@ from xray import XRay
 from xray.workflow_engine import GenericWorkflowEngine
 from xray.workflow import apply_filters_with_rules, rank_and_select_with_rules
 
+# pandas is only needed for file uploads; importing it lazily keeps worker
+# cold start and per-worker memory down for API-only deployments
+pd = None
+
+
+def _ensure_pandas() -> bool:
+    """Import pandas on first use and cache it in the module global."""
+    global pd
+    if pd is None:
+        try:
+            import pandas
+            pd = pandas
+        except ImportError:
+            return False
+    return True
+
+
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson instead of stdlib json."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = orjson.loads(body)
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands handlers an ORJSONRequest for faster body parsing."""
+
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request):
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
+
+def _schema_kind(dtype) -> str:
+    """Map a pandas dtype to a frontend schema type using C-level dtype predicates."""
+    try:
+        from pandas.api.types import (
+            is_integer_dtype, is_float_dtype, is_bool_dtype, is_datetime64_any_dtype
+        )
+        if is_integer_dtype(dtype) or is_float_dtype(dtype):
+            return "number"
+        if is_bool_dtype(dtype):
+            return "boolean"
+        if is_datetime64_any_dtype(dtype):
+            return "datetime"
+    except Exception:
+        pass
+    return "string"
+
 
 app = FastAPI(title="X-Ray Dashboard API", version="1.0.0")
 
+# Decode JSON request bodies with orjson (SIMD-accelerated) when available.
+# Must be set before routes are registered so all endpoints pick it up.
+if ORJSON_AVAILABLE:
+    app.router.route_class = ORJSONRoute
+
 # Enable CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
@@ -42,6 +106,14 @@ storage = SQLiteStorage()
 rules_config = RuleConfig()  # Load rules from CSV
 workflow_engine = GenericWorkflowEngine(storage=storage)
 
+# In-memory caches for uploaded datasets and workflow definitions.
+# Initialized once here (instead of hasattr probes on every request) and
+# guarded by a lock so concurrent async handlers can't lose entries.
+storage._datasets = {}
+storage._workflows = {}
+_datasets_lock = asyncio.Lock()
+_workflows_lock = asyncio.Lock()
+
 
 @app.get("/")
 async def root():
@@ -65,18 +137,26 @@ async def get_execution(execution_id: str):
     return execution
 
 
+def _public_rules(rules):
+    """Copy rules without the internal underscore-prefixed companion keys."""
+    return [
+        {k: v for k, v in rule.items() if not k.startswith('_')}
+        for rule in rules
+    ]
+
+
 @app.get("/api/rules")
 async def get_rules():
     """API endpoint to get current rules configuration."""
     try:
-        filters = rules_config.get_filters()
+        filters = _public_rules(rules_config.get_filters())
         ranking = rules_config.get_ranking_criteria()
         
         return {
             'filters': filters,
             'ranking': ranking,
             'rules_file': rules_config.rules_file,
-            'all_rules': rules_config.rules
+            'all_rules': _public_rules(rules_config.rules)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,7 +201,7 @@ async def set_rules(data: Dict[str, Any]):
         return {
             'success': True,
             'rules_count': len(new_rules.rules),
-            'filters': new_rules.get_filters(),
+            'filters': _public_rules(new_rules.get_filters()),
             'ranking': new_rules.get_ranking_criteria()
         }
     except HTTPException:
@@ -178,6 +258,74 @@ async def run_workflow(data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _to_canonical_evaluations(evaluations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert filter evaluations to canonical X-Ray format with detailed reasoning.
+
+    Specialized single-pass builder: per item, the filter results are walked
+    exactly once, collecting the checks and the passed/failed name lists
+    together instead of re-scanning filter_results for each summary line.
+    """
+    canonical = []
+    append = canonical.append
+
+    for eval_item in evaluations:
+        filters_passed = eval_item.get('filters_passed_count', 0)
+        total_filters = eval_item.get('total_filters', 0)
+
+        checks = []
+        passed_filters = []
+        failed_filters = []
+        for rule_name, result in eval_item.get("filter_results", {}).items():
+            # Build detailed reason for each filter check with field and value
+            field = result.get("field", rule_name)
+            field_value = result.get("field_value", "N/A")
+            expected = result.get("expected", "")
+            actual = result.get("actual", f"{field} = {field_value}")
+            passed = result.get("passed", False)
+
+            if passed:
+                passed_filters.append(rule_name)
+                reason = f"✓ Passed {rule_name}: {field} = {field_value} satisfies {expected}"
+            else:
+                failed_filters.append(rule_name)
+                reason = f"✗ Failed {rule_name}: {field} = {field_value} does not satisfy {expected}"
+
+            checks.append({
+                "rule": rule_name,
+                "passed": passed,
+                "expected": expected or f"Check {rule_name}",
+                "actual": actual,
+                "reason": reason,
+                "field": field,
+                "field_value": field_value
+            })
+
+        # Add summary check showing overall filter status
+        if total_filters > 0:
+            if filters_passed == total_filters:
+                summary_reason = f"✓ PASSED all {total_filters} filters: {', '.join(passed_filters)}"
+            else:
+                summary_reason = f"Passed {filters_passed}/{total_filters} filters. Passed: {', '.join(passed_filters) if passed_filters else 'none'}. Failed: {', '.join(failed_filters) if failed_filters else 'none'}."
+
+            checks.append({
+                "rule": "filter_summary",
+                "passed": filters_passed == total_filters,
+                "expected": f"Pass all {total_filters} filters",
+                "actual": f"Passed {filters_passed}/{total_filters} filters",
+                "reason": summary_reason
+            })
+
+        append({
+            "entity_id": eval_item.get("item_id", ""),
+            "attributes": eval_item.get("metrics", {}),
+            "checks": checks,
+            "final_decision": "accepted" if eval_item.get("passed", False) else "rejected"
+        })
+
+    return canonical
+
+
 def run_workflow_with_rules(input_data: dict, rules: RuleConfig, execution_name: Optional[str] = None):
     """Run workflow with provided rules config."""
     # Get execution name from input_data or use provided name
@@ -215,69 +363,11 @@ def run_workflow_with_rules(input_data: dict, rules: RuleConfig, execution_name:
         )
         
         # Convert evaluations to canonical format with detailed reasoning
-        canonical_evaluations = []
-        for eval_item in filter_result["evaluations"]:
-            checks = []
-            filters_passed = eval_item.get('filters_passed_count', 0)
-            total_filters = eval_item.get('total_filters', 0)
-            
-            for rule_name, result in eval_item.get("filter_results", {}).items():
-                # Build detailed reason for each filter check with field and value
-                detail = result.get("detail", result.get("reason", ""))
-                field = result.get("field", rule_name)
-                field_value = result.get("field_value", "N/A")
-                expected = result.get("expected", "")
-                actual = result.get("actual", f"{field} = {field_value}")
-                
-                if result.get("passed", False):
-                    reason = f"✓ Passed {rule_name}: {field} = {field_value} satisfies {expected}"
-                else:
-                    reason = f"✗ Failed {rule_name}: {field} = {field_value} does not satisfy {expected}"
-                
-                checks.append({
-                    "rule": rule_name,
-                    "passed": result.get("passed", False),
-                    "expected": expected or f"Check {rule_name}",
-                    "actual": actual,
-                    "reason": reason,
-                    "field": field,
-                    "field_value": field_value
-                })
-            
-            # Add summary check showing overall filter status
-            if total_filters > 0:
-                if filters_passed == total_filters:
-                    summary_reason = f"✓ PASSED all {total_filters} filters: {', '.join([name for name, r in eval_item.get('filter_results', {}).items() if r.get('passed', False)])}"
-                else:
-                    passed_filters = [name for name, r in eval_item.get('filter_results', {}).items() if r.get('passed', False)]
-                    failed_filters = [name for name, r in eval_item.get('filter_results', {}).items() if not r.get('passed', True)]
-                    summary_reason = f"Passed {filters_passed}/{total_filters} filters. Passed: {', '.join(passed_filters) if passed_filters else 'none'}. Failed: {', '.join(failed_filters) if failed_filters else 'none'}."
-                
-                checks.append({
-                    "rule": "filter_summary",
-                    "passed": filters_passed == total_filters,
-                    "expected": f"Pass all {total_filters} filters",
-                    "actual": f"Passed {filters_passed}/{total_filters} filters",
-                    "reason": summary_reason
-                })
-            
-            canonical_evaluations.append({
-                "entity_id": eval_item.get("item_id", ""),
-                "attributes": eval_item.get("metrics", {}),
-                "checks": checks,
-                "final_decision": "accepted" if eval_item.get("passed", False) else "rejected"
-            })
+        canonical_evaluations = _to_canonical_evaluations(filter_result["evaluations"])
         
-        # Get rules in canonical format
-        filter_rules = rules.get_filters('apply_filters')
-        canonical_rules = []
-        for rule in filter_rules:
-            canonical_rules.append({
-                "name": rule.get('name', 'unnamed'),
-                "type": rule.get('rule_type', 'threshold'),
-                "value": rule.get('value') or rule.get('min') or rule.get('max'),
-                "source": "config"
-            })
+        # Get rules in canonical format (cached on the RuleConfig, so repeat
+        # runs with the same rules don't rebuild the dict list)
+        canonical_rules = rules.canonical_filter_rules('apply_filters')
         
         filter_reasoning = rules.generate_filter_reasoning(
             filter_result["evaluations"],
@@ -360,28 +450,23 @@ def run_workflow_with_rules(input_data: dict, rules: RuleConfig, execution_name:
                 "final_decision": "selected" if candidate.get("item_id") == ranking_result["selection"].get("item_id") else "not_selected"
             })
         
-        # Get ranking criteria as rules
+        # Get ranking criteria as rules (cached on the RuleConfig)
         ranking_criteria = ranking_result["ranking_criteria"]
-        canonical_ranking_rules = []
-        if ranking_criteria.get("primary"):
-            canonical_ranking_rules.append({
-                "name": "primary_ranking",
-                "type": "ranking",
-                "value": ranking_criteria.get("primary"),
-                "source": "config"
-            })
-        if ranking_criteria.get("secondary"):
-            canonical_ranking_rules.append({
-                "name": "secondary_ranking",
-                "type": "ranking",
-                "value": ranking_criteria.get("secondary"),
-                "source": "config"
-            })
+        canonical_ranking_rules = rules.canonical_ranking_rules('rank_and_select')
+        if not canonical_ranking_rules and ranking_criteria:
+            # No ranking rule configured - describe the default criteria used
+            canonical_ranking_rules = [
+                {"name": f"{level}_ranking", "type": "ranking",
+                 "value": ranking_criteria[level], "source": "config"}
+                for level in ('primary', 'secondary')
+                if ranking_criteria.get(level)
+            ]
         
         ranking_reasoning = rules.generate_ranking_reasoning(
             ranking_result["ranked_candidates"],
             ranking_result["selected_item"],
-            step_name="rank_and_select"
+            step_name="rank_and_select",
+            ranked_by_id=ranking_result.get("ranked_by_id")
         )
         
         xray.record_step(
@@ -417,7 +502,7 @@ async def upload_dataset(file: UploadFile = File(...)):
     FastAPI/Starlette default limit is 100MB, which should be sufficient.
     If you need larger files, configure uvicorn with --limit-request-line and --limit-request-fields.
     """
-    if not PANDAS_AVAILABLE:
+    if not _ensure_pandas():
         raise HTTPException(status_code=500, detail="pandas is required for file upload. Install with: pip install pandas openpyxl")
     
     try:
@@ -566,7 +651,13 @@ async def upload_dataset(file: UploadFile = File(...)):
                 except Exception as e:
                     raise HTTPException(status_code=400, detail=f"Could not parse CSV file. Please ensure the file is a valid CSV with UTF-8 encoding: {str(e)}")
         elif file_extension in ['xlsx', 'xls']:
-            df = pd.read_excel(io.BytesIO(contents))
+            # Prefer the Rust-based calamine engine (5-10x faster on large
+            # workbooks); fall back to the default openpyxl engine if the
+            # python-calamine package isn't installed
+            try:
+                df = pd.read_excel(io.BytesIO(contents), engine="calamine")
+            except (ImportError, ValueError):
+                df = pd.read_excel(io.BytesIO(contents))
         elif file_extension == 'json':
             # Try multiple encodings for JSON as well
             encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'iso-8859-1', 'cp1252']
@@ -650,22 +741,9 @@ async def upload_dataset(file: UploadFile = File(...)):
             # If cleaning fails, continue with original data
             pass
         
-        # Detect schema
-        schema = {}
-        for col in df.columns:
-            try:
-                dtype = str(df[col].dtype)
-                # Infer type
-                if 'int' in dtype:
-                    schema[col] = "number"
-                elif 'float' in dtype:
-                    schema[col] = "number"
-                elif 'bool' in dtype:
-                    schema[col] = "boolean"
-                else:
-                    schema[col] = "string"
-            except Exception:
-                schema[col] = "string"  # Default to string if detection fails
+        # Detect schema from dtypes in one pass (handles datetime64, category,
+        # and nullable Int64/boolean dtypes that string matching would miss)
+        schema = {col: _schema_kind(dtype) for col, dtype in df.dtypes.items()}
         
         # Convert to list of dicts and clean data (limit preview to avoid memory issues)
         preview_rows = []
@@ -713,15 +791,14 @@ async def upload_dataset(file: UploadFile = File(...)):
         dataset_id = hashlib.md5(file.filename.encode() + str(len(full_rows)).encode()).hexdigest()[:8]
         
         # Store dataset (in-memory for now, can be extended to use storage)
-        if not hasattr(storage, '_datasets'):
-            storage._datasets = {}
-        storage._datasets[dataset_id] = {
-            "dataset_id": dataset_id,
-            "filename": file.filename,
-            "schema": schema,
-            "rows": full_rows,
-            "row_count": len(full_rows)
-        }
+        async with _datasets_lock:
+            storage._datasets[dataset_id] = {
+                "dataset_id": dataset_id,
+                "filename": file.filename,
+                "schema": schema,
+                "rows": full_rows,
+                "row_count": len(full_rows)
+            }
         
         # Final validation - ensure schema keys are readable
         clean_schema = {}
@@ -778,9 +855,9 @@ async def upload_dataset(file: UploadFile = File(...)):
 @app.get("/api/datasets/{dataset_id}")
 async def get_dataset(dataset_id: str):
     """Get dataset by ID."""
-    if not hasattr(storage, '_datasets') or dataset_id not in storage._datasets:
+    if dataset_id not in storage._datasets:
         raise HTTPException(status_code=404, detail="Dataset not found")
-    
+
     dataset = storage._datasets[dataset_id]
     return {
         "dataset_id": dataset_id,
@@ -794,9 +871,6 @@ async def get_dataset(dataset_id: str):
 @app.get("/api/datasets")
 async def list_datasets():
     """List all uploaded datasets."""
-    if not hasattr(storage, '_datasets'):
-        return []
-    
     return [
         {
             "dataset_id": dataset_id,
@@ -828,11 +902,10 @@ async def create_workflow(workflow: Dict[str, Any]):
     
     # Save to persistent storage (SQLite)
     storage.save_workflow(workflow_id, workflow)
-    
+
     # Also keep in memory for quick access
-    if not hasattr(storage, '_workflows'):
-        storage._workflows = {}
-    storage._workflows[workflow_id] = workflow
+    async with _workflows_lock:
+        storage._workflows[workflow_id] = workflow
     
     return {
         "success": True,
@@ -846,18 +919,16 @@ async def list_workflows():
     """List all workflow definitions."""
     # Load from persistent storage
     workflows = storage.list_workflows()
-    
+
     # Also sync to memory cache
-    if not hasattr(storage, '_workflows'):
-        storage._workflows = {}
-    
     for wf_summary in workflows:
         wf_id = wf_summary["workflow_id"]
         if wf_id not in storage._workflows:
             # Load full workflow into memory cache
             full_workflow = storage.get_workflow(wf_id)
             if full_workflow:
-                storage._workflows[wf_id] = full_workflow
+                async with _workflows_lock:
+                    storage._workflows[wf_id] = full_workflow
     
     return workflows
 
@@ -866,19 +937,18 @@ async def list_workflows():
 async def get_workflow(workflow_id: str):
     """Get workflow definition by ID."""
     # Try memory cache first
-    if hasattr(storage, '_workflows') and workflow_id in storage._workflows:
+    if workflow_id in storage._workflows:
         return storage._workflows[workflow_id]
-    
+
     # Load from persistent storage
     workflow = storage.get_workflow(workflow_id)
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
-    
+
     # Cache in memory
-    if not hasattr(storage, '_workflows'):
-        storage._workflows = {}
-    storage._workflows[workflow_id] = workflow
-    
+    async with _workflows_lock:
+        storage._workflows[workflow_id] = workflow
+
     return workflow
 
 
@@ -894,12 +964,8 @@ async def execute_workflow(workflow_id: str, data: Dict[str, Any]):
     }
     """
     # Get workflow (try memory cache, then persistent storage)
-    workflow = None
-    if hasattr(storage, '_workflows') and workflow_id in storage._workflows:
-        workflow = storage._workflows[workflow_id]
-    else:
-        workflow = storage.get_workflow(workflow_id)
-    
+    workflow = storage._workflows.get(workflow_id) or storage.get_workflow(workflow_id)
+
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
@@ -908,9 +974,9 @@ async def execute_workflow(workflow_id: str, data: Dict[str, Any]):
     if not dataset_id:
         raise HTTPException(status_code=400, detail="dataset_id is required")
     
-    if not hasattr(storage, '_datasets') or dataset_id not in storage._datasets:
+    if dataset_id not in storage._datasets:
         raise HTTPException(status_code=404, detail="Dataset not found")
-    
+
     dataset = storage._datasets[dataset_id]
     rows = dataset["rows"]
     
@@ -5,11 +5,215 @@ Rules define filters, ranking criteria, and other decision logic.
 """
 
 import csv
+import functools
+import hashlib
+import heapq
+import io
 import json
+import re
+import sys
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 from urllib.parse import urlparse
 
+try:
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Candidate-list size above which apply_filters tries the vectorized path
+_VECTORIZE_MIN_ITEMS = 200
+
+# Identity-keyed compiled-rule cache is wiped once it reaches this many
+# entries, so callers passing fresh ad-hoc rule dicts cannot grow it
+# without limit
+_COMPILED_RULE_CACHE_MAX = 512
+
+# Contains rules per field before batching them into one Aho-Corasick scan
+_AHO_MIN_RULES = 4
+
+# Metric fields surfaced in reasoning summaries, in display order
+_METRIC_KEYS = ('price', 'rating', 'reviews', 'value', 'score', 'count')
+
+# Display formatter per metric key; one dict dispatch replaces the per-key
+# if/elif ladder in the render loops
+_METRIC_FORMATTERS = {
+    'price': '${:.2f}'.format,
+    'rating': '{}★'.format,
+    'reviews': str,
+    'value': str,
+    'score': str,
+    'count': str,
+}
+
+# Source-type detection tables: file extension -> type, Google Sheets hosts
+_EXT_MAP = (('.json', 'json'), ('.csv', 'csv'))
+_GSHEETS_HOSTS = ('docs.google.com', 'drive.google.com')
+
+if ORJSON_AVAILABLE:
+    def _dumps(obj: Any) -> str:
+        """Serialize to a JSON string via orjson."""
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = json.dumps
+
+# Dicts at or below this many keys get dumped whole when no summary field matches
+_SUMMARY_DUMP_MAX_KEYS = 8
+
+# Field order and formatters for _summarize_data (selected_item handled separately)
+_SUMMARY_FIELDS = (
+    ('candidates_count', "{} candidates".format),
+    ('total_evaluated', "{} evaluated".format),
+    ('passed', "{} passed".format),
+    ('failed', "{} failed".format),
+)
+
+# Per-rule-type templates for the "Filters Applied" descriptions; rules
+# missing their threshold fall back to the bare "{name} ({field})" form
+_FILTER_DESC_TEMPLATES = {
+    'range': "{name} ({field}: {min}-{max})",
+    'min': "{name} ({field}: ≥{value})",
+    'max': "{name} ({field}: ≤{value})",
+    'equals': "{name} ({field}: =={value})",
+    'contains': "{name} ({field}: contains '{value}')",
+}
+
+# Interned reasoning prefixes shared across every rendered string
+_MAIN_REASONING = sys.intern("Main Reasoning: ")
+_RANKING_DETAILS = sys.intern("Ranking Details:")
+_FINAL_REC = sys.intern("\nFinal Recommendation:")
+
+# Max rendered reasoning strings kept per RuleConfig (LRU)
+_REASONING_CACHE_SIZE = 256
+
+# Extracts the value mentioned in a filter detail string (e.g. "$34.99 is within range...")
+_DETAIL_VALUE_RE = re.compile(r'(\$?[\d.]+|[\w]+)')
+
+
+def _coerce_numeric(v: str, cache: Dict[str, Any]) -> Any:
+    """
+    Parse a threshold string to int/float, memoized in the given cache.
+
+    isdigit() settles the integer case without raising, so only genuine
+    floats/non-numerics reach float(); non-numeric strings come back as-is.
+    """
+    coerced = cache.get(v)
+    if coerced is None:
+        if (v[1:] if v[0] in '+-' else v).isdigit():
+            coerced = int(v)
+        else:
+            try:
+                coerced = float(v)
+            except ValueError:
+                coerced = v
+        cache[v] = coerced
+    return coerced
+
+
+@functools.lru_cache(maxsize=256)
+def _infer_step_kind(step_name: str) -> str:
+    """
+    Classify a step name as 'filter', 'rank', or 'other' for reasoning dispatch.
+
+    Workflows reuse a small set of step names across many executions, so the
+    lowercase + substring scans are memoized; dispatch then reduces to exact
+    string comparison.
+    """
+    step_lower = step_name.lower()
+    if 'filter' in step_lower:
+        return 'filter'
+    if 'rank' in step_lower or 'select' in step_lower:
+        return 'rank'
+    return 'other'
+
+
+class FilterResult:
+    """
+    Lightweight per-filter evaluation record.
+
+    Slots keep the footprint well under a 7-key dict for the N items x F
+    filters results apply_filters produces. Storage backends serialize
+    evaluations with json.dumps, so the dict form stays the default exchange
+    format — callers opt in via apply_filters(..., as_records=True) and can
+    convert back with to_dict() when they need JSON.
+    """
+
+    __slots__ = ('passed', 'detail', 'field', 'field_value', 'rule_type', 'expected', 'actual')
+
+    def __init__(self, passed, detail, field, field_value, rule_type, expected, actual):
+        self.passed = passed
+        self.detail = detail
+        self.field = field
+        self.field_value = field_value
+        self.rule_type = rule_type
+        self.expected = expected
+        self.actual = actual
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain-dict result format used for serialization."""
+        return {
+            'passed': self.passed,
+            'detail': self.detail,
+            'field': self.field,
+            'field_value': self.field_value,
+            'rule_type': self.rule_type,
+            'expected': self.expected,
+            'actual': self.actual
+        }
+
+
+class _LazyReasoning:
+    """
+    Defers reasoning generation until the string is actually needed.
+
+    Builds the text on first str()/repr() and memoizes it, mirroring
+    logging's deferred %-formatting: steps whose reasoning is never
+    displayed never pay for rendering. Note this is not a str — callers
+    that store reasoning via json.dumps must str() it first, which is why
+    generate_step_reasoning only returns it behind lazy=True.
+    """
+
+    __slots__ = ('_fn', '_args', '_kwargs', '_value')
+
+    def __init__(self, fn, *args, **kwargs):
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._fn(*self._args, **self._kwargs)
+        return self._value
+
+    __repr__ = __str__
+
 
 class RuleConfig:
     """
@@ -18,10 +222,11 @@ class RuleConfig:
     Rules define filters, ranking criteria, and other decision logic.
     """
     
-    def __init__(self, rules_source: Optional[Union[str, Dict, List]] = None):
+    def __init__(self, rules_source: Optional[Union[str, Dict, List]] = None,
+                 lazy: bool = False):
         """
         Initialize rule configuration.
-        
+
         Args:
             rules_source: Can be:
                 - Path to CSV file (e.g., "rules.csv")
@@ -30,32 +235,53 @@ class RuleConfig:
                 - Dictionary with rules data
                 - List of rule dictionaries
                 - None: uses default "rules.csv"
+            lazy: If True, CSV sources are streamed row-by-row straight into
+                the per-step indexes without retaining a flat rules list;
+                .rules materializes on demand from the indexes
         """
         self.rules_source = rules_source or "rules.csv"
-        self.rules: List[Dict[str, Any]] = []
+        self._lazy = lazy
+        self.rules = []
         self.source_type = None
+        self._canonical_cache: Dict[Any, List[Dict[str, Any]]] = {}
+        self._compiled_filters: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._compiled_by_rule_id: Dict[int, Dict[str, Any]] = {}
+        self._automaton_cache: Dict[Optional[str], Dict[str, Any]] = {}
+        self._filters_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+        self._rankings_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+        self._ranking_cache: Dict[Optional[str], Optional[Dict[str, Any]]] = {}
+        self._criteria_desc_cache: Dict[Optional[str], tuple] = {}
+        self._reasoning_cache: 'OrderedDict[bytes, str]' = OrderedDict()
         self.load_rules()
     
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        """Flat rule list; materialized from the indexes under lazy loading."""
+        if self._rules is None:
+            self._rules = self._filters_by_step[None] + self._rankings_by_step[None]
+        return self._rules
+
+    @rules.setter
+    def rules(self, value: Optional[List[Dict[str, Any]]]):
+        self._rules = value
+
     def _detect_source_type(self, source: Union[str, Dict, List]) -> str:
         """Detect the type of rules source."""
-        if isinstance(source, dict):
+        if type(source) is dict:
             return 'dict'
-        elif isinstance(source, list):
+        if type(source) is list:
             return 'list'
-        elif isinstance(source, str):
+        if isinstance(source, str):
             source_lower = source.lower()
-            if source_lower.endswith('.json'):
-                return 'json'
-            elif source_lower.endswith('.csv'):
-                return 'csv'
-            elif 'docs.google.com' in source_lower or 'drive.google.com' in source_lower:
+            for ext, source_type in _EXT_MAP:
+                if source_lower.endswith(ext):
+                    return source_type
+            if any(host in source_lower for host in _GSHEETS_HOSTS):
                 return 'google_sheets'
-            elif len(source) > 10 and '/' not in source and '\\' not in source:
+            if len(source) > 10 and '/' not in source and '\\' not in source:
                 # Might be a Google Sheets ID
                 return 'google_sheets_id'
-            else:
-                # Default to CSV
-                return 'csv'
+        # Default to CSV
         return 'csv'
     
     def _load_from_csv(self, file_path: str):
@@ -67,14 +293,57 @@ class RuleConfig:
             self.rules = []
             return
         
-        try:
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                self.rules = list(reader)
-            self._normalize_rules()
-        except Exception as e:
-            print(f"Warning: Could not load rules from {file_path}: {e}")
-            self.rules = []
+        if self._lazy:
+            # Stream rows straight into the per-step indexes: each row is
+            # normalized and routed as it is parsed, rows no step can ask for
+            # are dropped, and no flat list is retained. .rules materializes
+            # from the indexes only if a caller demands it.
+            filters_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+            rankings_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+            num_cache: Dict[str, Any] = {}
+            try:
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    for row in csv.DictReader(f):
+                        self._normalize_rule(row, num_cache)
+                        self._index_rule(row, filters_by_step, rankings_by_step)
+            except Exception as e:
+                print(f"Warning: Could not load rules from {file_path}: {e}")
+                self.rules = []
+                return
+            self._filters_by_step = filters_by_step
+            self._rankings_by_step = rankings_by_step
+            self.rules = None
+            return
+
+        rows = None
+        if PYARROW_AVAILABLE:
+            # C-level tokenizer; also infers numeric value/min/max columns
+            # natively so _normalize_rules has little left to coerce.
+            # pyarrow is stricter than DictReader about ragged rows, so fall
+            # back to the stdlib reader if it can't parse the file.
+            try:
+                table = pa_csv.read_csv(str(rules_path))
+                # Empty CSV cells come back as None; keep the empty-string
+                # convention DictReader rows use so downstream lookups match
+                rows = [
+                    {k: ('' if v is None else v) for k, v in row.items()}
+                    for row in table.to_pylist()
+                ]
+            except Exception:
+                rows = None
+
+        if rows is None:
+            try:
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    rows = list(reader)
+            except Exception as e:
+                print(f"Warning: Could not load rules from {file_path}: {e}")
+                self.rules = []
+                return
+
+        self.rules = rows
+        self._normalize_rules()
     
     def _load_from_json(self, file_path: str):
         """Load rules from JSON file."""
@@ -86,9 +355,18 @@ class RuleConfig:
             return
         
         try:
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            if ORJSON_AVAILABLE:
+                # orjson parses bytes directly (SIMD-accelerated), 2-5x
+                # faster than stdlib json on large rules files
+                with open(rules_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            elif UJSON_AVAILABLE:
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    data = ujson.load(f)
+            else:
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
             # Handle different JSON structures
             if isinstance(data, list):
                 self.rules = data
@@ -102,6 +380,18 @@ class RuleConfig:
             print(f"Warning: Could not load rules from {file_path}: {e}")
             self.rules = []
     
+    # Authorized gspread client shared across instances; credential setup is
+    # the expensive part, so it runs once per process
+    _gspread_client = None
+
+    @classmethod
+    def _get_gspread_client(cls):
+        """Authorize gspread on first use and reuse the client afterwards."""
+        if cls._gspread_client is None:
+            import gspread
+            cls._gspread_client = gspread.service_account()
+        return cls._gspread_client
+
     def _load_from_google_sheets(self, source: str):
         """Load rules from Google Sheets."""
         try:
@@ -117,18 +407,19 @@ class RuleConfig:
             else:
                 self.rules = []
             return
-        
+
         try:
             # Extract sheet ID from URL or use as-is
             sheet_id = self._extract_sheet_id(source)
-            
-            # Try to authenticate (user needs to set up credentials)
-            # For now, we'll provide instructions
-            print("Warning: Google Sheets integration requires authentication setup.")
-            print("Please export your Google Sheet as CSV and use that instead, or set up OAuth2 credentials.")
-            self.rules = []
+
+            # get_all_records is a single HTTP round trip for the whole sheet
+            client = self._get_gspread_client()
+            worksheet = client.open_by_key(sheet_id).sheet1
+            self.rules = worksheet.get_all_records()
+            self._normalize_rules()
         except Exception as e:
             print(f"Warning: Could not load rules from Google Sheets: {e}")
+            print("Please export your Google Sheet as CSV and use that instead, or set up service-account credentials.")
             self.rules = []
     
     def _extract_sheet_id(self, source: str) -> str:
@@ -155,37 +446,70 @@ class RuleConfig:
         self.rules = data
         self._normalize_rules()
     
+    def _normalize_rule(self, rule: Dict[str, Any], num_cache: Dict[str, Any]):
+        """Coerce threshold strings and set lowered companion keys on one rule."""
+        for key in ('value', 'min', 'max'):
+            v = rule.get(key)
+            if isinstance(v, str) and v:
+                rule[key] = _coerce_numeric(v, num_cache)
+
+        # Pre-lowered companion keys so hot paths skip repeated .lower();
+        # interned since the same few values repeat across all rules
+        rule['_type_lc'] = sys.intern(str(rule.get('type', '')).lower())
+        rule['_rule_type_lc'] = sys.intern(str(rule.get('rule_type', '')).lower())
+        rule['_step_lc'] = sys.intern(str(rule.get('step', '')).lower())
+        rule['_field_lc'] = sys.intern(str(rule.get('field', '')).lower())
+
+        # Contains rules compare lowercased text; lower the needle once at
+        # load instead of per (item, rule) evaluation
+        if rule['_rule_type_lc'] == 'contains' and rule.get('value') is not None:
+            rule['_value_lower'] = str(rule['value']).lower()
+
+    @staticmethod
+    def _index_rule(rule: Dict[str, Any],
+                    filters_by_step: Dict[Optional[str], List[Dict[str, Any]]],
+                    rankings_by_step: Dict[Optional[str], List[Dict[str, Any]]]):
+        """Route one normalized rule into the (type, step) indexes."""
+        type_lc = rule['_type_lc']
+        if type_lc == 'filter':
+            index = filters_by_step
+        elif type_lc == 'ranking':
+            index = rankings_by_step
+        else:
+            return
+        index[None].append(rule)
+        step_lc = rule['_step_lc']
+        if step_lc:
+            index.setdefault(step_lc, []).append(rule)
+
     def _normalize_rules(self):
-        """Convert string values to appropriate types in rules."""
+        """Convert string values to appropriate types and index the rules."""
+        # Thresholds repeat across rules (the same '4.0' or '100' shows up in
+        # many rows), so each distinct string is parsed once per load
+        num_cache: Dict[str, Any] = {}
+
+        # Index rules by (type, step) in one pass so get_filters /
+        # get_ranking_criteria are dict lookups instead of full-list scans.
+        # The None bucket holds every rule of that type (step_name omitted).
+        filters_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+        rankings_by_step: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
         for rule in self.rules:
-            if 'value' in rule and rule['value']:
-                try:
-                    if isinstance(rule['value'], str) and '.' in rule['value']:
-                        rule['value'] = float(rule['value'])
-                    elif isinstance(rule['value'], str):
-                        try:
-                            rule['value'] = int(rule['value'])
-                        except ValueError:
-                            pass  # Keep as string
-                except (ValueError, TypeError):
-                    pass
-            
-            if 'min' in rule and rule['min']:
-                try:
-                    if isinstance(rule['min'], str):
-                        rule['min'] = float(rule['min'])
-                except (ValueError, TypeError):
-                    pass
-            
-            if 'max' in rule and rule['max']:
-                try:
-                    if isinstance(rule['max'], str):
-                        rule['max'] = float(rule['max'])
-                except (ValueError, TypeError):
-                    pass
+            self._normalize_rule(rule, num_cache)
+            self._index_rule(rule, filters_by_step, rankings_by_step)
+        self._filters_by_step = filters_by_step
+        self._rankings_by_step = rankings_by_step
     
     def load_rules(self):
         """Load rules from the configured source."""
+        self._canonical_cache.clear()
+        self._compiled_filters.clear()
+        self._compiled_by_rule_id.clear()
+        self._automaton_cache.clear()
+        self._filters_by_step = {None: []}
+        self._rankings_by_step = {None: []}
+        self._ranking_cache.clear()
+        self._criteria_desc_cache.clear()
+        self._reasoning_cache.clear()
         self.source_type = self._detect_source_type(self.rules_source)
         
         if self.source_type == 'csv':
@@ -201,6 +525,19 @@ class RuleConfig:
         else:
             self.rules = []
     
+    async def load_rules_async(self):
+        """
+        Load rules without blocking the event loop.
+
+        Runs the synchronous loader in a worker thread so callers doing other
+        startup I/O can overlap it, e.g.
+        ``await asyncio.gather(rules.load_rules_async(), other_io())``.
+        The constructor keeps the synchronous path — for a single small
+        config file the thread handoff costs more than it saves.
+        """
+        import asyncio
+        await asyncio.to_thread(self.load_rules)
+
     def get_filters(self, step_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get filter rules.
@@ -211,12 +548,8 @@ class RuleConfig:
         Returns:
             List of filter rule dictionaries
         """
-        filters = [r for r in self.rules if r.get('type', '').lower() == 'filter']
-        
-        if step_name:
-            filters = [f for f in filters if f.get('step', '').lower() == step_name.lower()]
-        
-        return filters
+        step_lc = step_name.lower() if step_name else None
+        return self._filters_by_step.get(step_lc, [])
     
     def get_ranking_criteria(self, step_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -228,203 +561,580 @@ class RuleConfig:
         Returns:
             Ranking criteria dictionary or None
         """
-        rankings = [r for r in self.rules if r.get('type', '').lower() == 'ranking']
-        
-        if step_name:
-            rankings = [r for r in rankings if r.get('step', '').lower() == step_name.lower()]
-        
+        step_lc = step_name.lower() if step_name else None
+        if step_lc in self._ranking_cache:
+            return self._ranking_cache[step_lc]
+
+        rankings = self._rankings_by_step.get(step_lc, [])
+
+        criteria = None
         if rankings:
             ranking = rankings[0]  # Use first ranking rule
-            return {
+            criteria = {
                 'primary': ranking.get('primary', ''),
                 'secondary': ranking.get('secondary', ''),
                 'tertiary': ranking.get('tertiary', '')
             }
-        
-        return None
+
+        self._ranking_cache[step_lc] = criteria
+        return criteria
     
-    def apply_filter(self, item: Dict[str, Any], filter_rule: Dict[str, Any]) -> Dict[str, Any]:
+    def canonical_filter_rules(self, step_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get filter rules in canonical X-Ray format, computed once per rule load.
+
+        The canonical form only changes when rules are (re)loaded, so it is
+        cached to avoid rebuilding the dict list on every workflow run.
+
+        Returns:
+            List of {"name", "type", "value", "source"} rule dictionaries
+        """
+        cache_key = ('filter', step_name)
+        cached = self._canonical_cache.get(cache_key)
+        if cached is None:
+            cached = [
+                {
+                    "name": rule.get('name', 'unnamed'),
+                    "type": rule.get('rule_type', 'threshold'),
+                    "value": rule.get('value') or rule.get('min') or rule.get('max'),
+                    "source": "config"
+                }
+                for rule in self.get_filters(step_name)
+            ]
+            self._canonical_cache[cache_key] = cached
+        return cached
+
+    def canonical_ranking_rules(self, step_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get ranking criteria in canonical X-Ray format, computed once per rule load.
+
+        Returns:
+            List of {"name", "type", "value", "source"} rule dictionaries
+        """
+        cache_key = ('ranking', step_name)
+        cached = self._canonical_cache.get(cache_key)
+        if cached is None:
+            cached = []
+            criteria = self.get_ranking_criteria(step_name) or {}
+            # Only primary/secondary are recorded, matching the payload
+            # shape from before this was memoized
+            for level in ('primary', 'secondary'):
+                if criteria.get(level):
+                    cached.append({
+                        "name": f"{level}_ranking",
+                        "type": "ranking",
+                        "value": criteria.get(level),
+                        "source": "config"
+                    })
+            self._canonical_cache[cache_key] = cached
+        return cached
+
+    def _compiled_for(self, filter_rule: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compiled record for a rule dict, cached by identity.
+
+        The compiled record pins the rule, so the id key stays valid while
+        the entry lives. The cache is dropped on rules reload and wiped at
+        _COMPILED_RULE_CACHE_MAX entries; the config's own rules simply
+        recompile once after a wipe.
+        """
+        compiled = self._compiled_by_rule_id.get(id(filter_rule))
+        if compiled is None:
+            compiled = self._compile_filter_rule(filter_rule)
+            if len(self._compiled_by_rule_id) >= _COMPILED_RULE_CACHE_MAX:
+                self._compiled_by_rule_id.clear()
+            self._compiled_by_rule_id[id(filter_rule)] = compiled
+        return compiled
+
+    def apply_filter(self, item: Dict[str, Any], filter_rule: Dict[str, Any],
+                     key_map: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Apply a single filter rule to an item.
-        
+
         Args:
             item: Item to filter
             filter_rule: Filter rule definition
-        
+            key_map: Optional precomputed {lowercase_key: key} map for the item,
+                letting callers that evaluate many rules per item skip the key scan
+
         Returns:
-            Dictionary with 'passed' (bool) and 'detail' (str) keys
+            Enriched result dict with 'passed', 'detail', 'field', 'field_value',
+            'rule_type', 'expected' and 'actual' keys
         """
-        field = filter_rule.get('field', '')
-        rule_type = filter_rule.get('rule_type', '').lower()
-        value = filter_rule.get('value')
-        min_val = filter_rule.get('min')
-        max_val = filter_rule.get('max')
-        
-        # Case-insensitive field matching
-        if not field:
-            return {
-                'passed': False,
-                'detail': f'Field "{field}" not found in item'
-            }
-        
-        # Find field with case-insensitive matching
-        field_lower = field.lower()
-        matched_field = None
-        for key in item.keys():
-            if key.lower() == field_lower:
-                matched_field = key
-                break
-        
-        if not matched_field:
-            return {
-                'passed': False,
-                'detail': f'Field "{field}" not found in item'
-            }
-        
-        item_value = item[matched_field]
-        
+        # Reuse the compiled record across calls with the same rule dict
+        compiled = self._compiled_for(filter_rule)
+        if key_map is None:
+            key_map = {k.lower(): k for k in item}
+        return self._evaluate_compiled(compiled, item, key_map)
+
+    def _evaluate_compiled(self, compiled: Dict[str, Any], item: Dict[str, Any],
+                           key_map: Dict[str, str],
+                           lower_cache: Optional[Dict[str, str]] = None,
+                           as_record: bool = False,
+                           contains_hits: Optional[Dict[str, set]] = None) -> Any:
+        """
+        Evaluate one compiled filter record against an item.
+
+        lower_cache, when provided, memoizes str(value).lower() per field so
+        several 'contains' rules on the same field lowercase the value once.
+        contains_hits maps field_lower -> needles an Aho-Corasick scan already
+        found in this item, letting contains rules skip the substring search.
+        Returns a FilterResult instead of a dict when as_record is set.
+        """
+        field = compiled['field']
+        field_lower = compiled['field_lower']
+        matched_field = key_map.get(field_lower) if field else None
+        item_value = item[matched_field] if matched_field is not None else None
+
+        if matched_field is None:
+            passed = False
+            detail = f'Field "{field}" not found in item'
+        elif (contains_hits is not None and compiled['kind'] == 'contains'
+              and field_lower in contains_hits):
+            passed = compiled['needle'] in contains_hits[field_lower]
+            value = compiled['rule'].get('value')
+            detail = f'"{value}" {"found in" if passed else "not found in"} "{item_value}"'
+        elif lower_cache is not None and compiled['kind'] == 'contains':
+            v_lower = lower_cache.get(field_lower)
+            if v_lower is None:
+                v_lower = str(item_value).lower()
+                lower_cache[field_lower] = v_lower
+            passed = compiled['needle'] in v_lower
+            value = compiled['rule'].get('value')
+            detail = f'"{value}" {"found in" if passed else "not found in"} "{item_value}"'
+        else:
+            passed, detail = compiled['predicate'](item_value)
+
+        actual = f"{field} = {item_value}" if item_value is not None else f"{field} = N/A"
+        if as_record:
+            return FilterResult(passed, detail, field, item_value,
+                                compiled['rule_type'], compiled['expected'], actual)
+        return {
+            'passed': passed,
+            'detail': detail,
+            'field': field,
+            'field_value': item_value,
+            'rule_type': compiled['rule_type'],
+            'expected': compiled['expected'],
+            'actual': actual
+        }
+    
+    def _compile_filter_rule(self, rule: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compile a single filter rule into a predicate record.
+
+        The rule_type dispatch, threshold lookups, and expected-value string
+        only depend on the rule, so they are resolved once here instead of
+        per (item, rule) pair inside apply_filters.
+        """
+        field = rule.get('field', '')
+        rule_type = rule.get('rule_type', '')
+        rule_type_lc = rule.get('_rule_type_lc', str(rule_type).lower())
+        value = rule.get('value')
+        min_val = rule.get('min')
+        max_val = rule.get('max')
+
+        predicate = None
+        kind = 'unknown'
+        needle = None
+        if rule_type_lc == 'range' and min_val is not None and max_val is not None:
+            kind = 'range'
+            def test(v, lo=min_val, hi=max_val):
+                return lo <= v <= hi
+            def predicate(v, lo=min_val, hi=max_val):
+                passed = lo <= v <= hi
+                return passed, f'{v} is {"within" if passed else "outside"} range {lo}-{hi}'
+        elif rule_type_lc == 'min' and value is not None:
+            kind = 'min'
+            def test(v, val=value):
+                # Case-insensitive string comparison for strings
+                if isinstance(v, str) or isinstance(val, str):
+                    return str(v).lower() >= str(val).lower()
+                return v >= val
+            def predicate(v, val=value, test=test):
+                passed = test(v)
+                return passed, f'{v} {"≥" if passed else "<"} {val}'
+        elif rule_type_lc == 'max' and value is not None:
+            kind = 'max'
+            def test(v, val=value):
+                if isinstance(v, str) or isinstance(val, str):
+                    return str(v).lower() <= str(val).lower()
+                return v <= val
+            def predicate(v, val=value, test=test):
+                passed = test(v)
+                return passed, f'{v} {"≤" if passed else ">"} {val}'
+        elif rule_type_lc == 'equals' and value is not None:
+            kind = 'equals'
+            def test(v, val=value):
+                if isinstance(v, str) or isinstance(val, str):
+                    return str(v).lower() == str(val).lower()
+                return v == val
+            def predicate(v, val=value, test=test):
+                passed = test(v)
+                return passed, f'{v} {"==" if passed else "!="} {val}'
+        elif rule_type_lc == 'contains' and value is not None:
+            kind = 'contains'
+            needle = rule.get('_value_lower') or str(value).lower()
+            def test(v, needle=needle):
+                # Skip the str() materialization when the value already is one
+                return needle in (v.lower() if isinstance(v, str) else str(v).lower())
+            def predicate(v, val=value, test=test):
+                passed = test(v)
+                return passed, f'"{val}" {"found in" if passed else "not found in"} "{v}"'
+        else:
+            def test(v):
+                return True
+            def predicate(v, rt=rule_type_lc):
+                return True, f'Unknown rule type: {rt}'
+
         if rule_type == 'range':
-            if min_val is not None and max_val is not None:
-                passed = min_val <= item_value <= max_val
-                detail = f'{item_value} is {"within" if passed else "outside"} range {min_val}-{max_val}'
-                return {'passed': passed, 'detail': detail}
-        
+            expected = f"{field} in [{min_val}-{max_val}]"
         elif rule_type == 'min':
-            if value is not None:
-                # Case-insensitive string comparison for strings
-                if isinstance(item_value, str) or isinstance(value, str):
-                    passed = str(item_value).lower() >= str(value).lower()
-                else:
-                    passed = item_value >= value
-                detail = f'{item_value} {"≥" if passed else "<"} {value}'
-                return {'passed': passed, 'detail': detail}
-        
+            expected = f"{field} >= {value}"
         elif rule_type == 'max':
-            if value is not None:
-                # Case-insensitive string comparison for strings
-                if isinstance(item_value, str) or isinstance(value, str):
-                    passed = str(item_value).lower() <= str(value).lower()
-                else:
-                    passed = item_value <= value
-                detail = f'{item_value} {"≤" if passed else ">"} {value}'
-                return {'passed': passed, 'detail': detail}
-        
+            expected = f"{field} <= {value}"
         elif rule_type == 'equals':
-            if value is not None:
-                # Case-insensitive string comparison
-                if isinstance(item_value, str) or isinstance(value, str):
-                    passed = str(item_value).lower() == str(value).lower()
-                else:
-                    passed = item_value == value
-                detail = f'{item_value} {"==" if passed else "!="} {value}'
-                return {'passed': passed, 'detail': detail}
-        
+            expected = f"{field} == {value}"
         elif rule_type == 'contains':
-            if value is not None:
-                passed = str(value).lower() in str(item_value).lower()
-                detail = f'"{value}" {"found in" if passed else "not found in"} "{item_value}"'
-                return {'passed': passed, 'detail': detail}
-        
-        # Default: pass if rule type not recognized
+            expected = f"{field} contains '{value}'"
+        else:
+            expected = f"{field} {rule_type} {value if value is not None else ''}"
+
         return {
-            'passed': True,
-            'detail': f'Unknown rule type: {rule_type}'
+            'rule': rule,
+            'name': rule.get('name', 'unnamed_filter'),
+            'field': field,
+            'field_lower': rule.get('_field_lc', field.lower() if field else ''),
+            'rule_type': rule_type,
+            'rule_type_lc': rule_type_lc,
+            'kind': kind,
+            'needle': needle,
+            'predicate': predicate,
+            'test': test,
+            'expected': expected,
         }
-    
-    def apply_filters(self, items: List[Dict[str, Any]], step_name: Optional[str] = None) -> List[Dict[str, Any]]:
+
+    def _compile_filters(self, step_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get compiled filter records for a step, building them on first use."""
+        cache_key = step_name.lower() if step_name else None
+        compiled = self._compiled_filters.get(cache_key)
+        if compiled is None:
+            compiled = [self._compile_filter_rule(r) for r in self.get_filters(step_name)]
+            self._compiled_filters[cache_key] = compiled
+        return compiled
+
+    def _contains_automatons(self, step_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get per-field Aho-Corasick automatons for a step's contains rules.
+
+        Fields with several contains rules get their needles compiled into one
+        automaton so each item's text is scanned once instead of once per
+        rule. Returns an empty dict when pyahocorasick is unavailable or no
+        field crosses the threshold.
+        """
+        cache_key = step_name.lower() if step_name else None
+        automatons = self._automaton_cache.get(cache_key)
+        if automatons is None:
+            automatons = {}
+            if AHOCORASICK_AVAILABLE:
+                needles_by_field: Dict[str, List[str]] = {}
+                for compiled in self._compile_filters(step_name):
+                    if compiled['kind'] == 'contains':
+                        needles_by_field.setdefault(compiled['field_lower'], []).append(compiled['needle'])
+                for field_lower, needles in needles_by_field.items():
+                    if len(needles) >= _AHO_MIN_RULES:
+                        automaton = ahocorasick.Automaton()
+                        for needle in needles:
+                            automaton.add_word(needle, needle)
+                        automaton.make_automaton()
+                        automatons[field_lower] = automaton
+            self._automaton_cache[cache_key] = automatons
+        return automatons
+
+    def _render_detail(self, compiled: Dict[str, Any], item_value: Any, passed: bool) -> str:
+        """Render the detail string for a known pass/fail outcome (vectorized path)."""
+        kind = compiled['kind']
+        rule = compiled['rule']
+        if kind == 'range':
+            return f'{item_value} is {"within" if passed else "outside"} range {rule.get("min")}-{rule.get("max")}'
+        if kind == 'min':
+            return f'{item_value} {"≥" if passed else "<"} {rule.get("value")}'
+        if kind == 'max':
+            return f'{item_value} {"≤" if passed else ">"} {rule.get("value")}'
+        if kind == 'equals':
+            return f'{item_value} {"==" if passed else "!="} {rule.get("value")}'
+        if kind == 'contains':
+            return f'"{rule.get("value")}" {"found in" if passed else "not found in"} "{item_value}"'
+        return f'Unknown rule type: {compiled["rule_type_lc"]}'
+
+    def _apply_filters_vectorized(
+        self,
+        items: List[Dict[str, Any]],
+        compiled_rules: List[Dict[str, Any]],
+        _index_offset: int = 0
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Evaluate all filters as vectorized column operations on a DataFrame.
+
+        Comparisons run as C-level boolean masks instead of a Python double
+        loop over items x rules. Returns None when the rules or data are not
+        uniformly vectorizable (missing columns, nulls, string thresholds on
+        numeric ops) so apply_filters can fall back to the scalar path with
+        identical results.
+        """
+        try:
+            df = pd.DataFrame(items)
+        except Exception:
+            return None
+
+        col_map = {str(c).lower(): c for c in df.columns}
+        masks = []
+        rule_cols = []
+        for compiled in compiled_rules:
+            col = col_map.get(compiled['field_lower']) if compiled['field'] else None
+            if col is None:
+                return None
+            series = df[col]
+            if series.isna().any():
+                return None
+
+            kind = compiled['kind']
+            rule = compiled['rule']
+            value = rule.get('value')
+            if kind in ('range', 'min', 'max', 'equals'):
+                # The scalar path has case-insensitive string semantics for
+                # these; only vectorize the purely numeric case
+                if not pd.api.types.is_numeric_dtype(series):
+                    return None
+                if kind == 'range':
+                    lo, hi = rule.get('min'), rule.get('max')
+                    if isinstance(lo, str) or isinstance(hi, str):
+                        return None
+                    mask = series.between(lo, hi)
+                else:
+                    if isinstance(value, str):
+                        return None
+                    mask = series.ge(value) if kind == 'min' else series.le(value) if kind == 'max' else series.eq(value)
+            elif kind == 'contains':
+                mask = series.astype(str).str.lower().str.contains(str(value).lower(), regex=False)
+            else:
+                # Unknown rule types always pass
+                mask = pd.Series(True, index=df.index)
+
+            masks.append(mask.to_numpy())
+            rule_cols.append(col)
+
+        evaluations = []
+        total_filters = len(compiled_rules)
+        for i, item in enumerate(items):
+            item_id = item.get('id') or item.get('asin') or str(i + _index_offset)
+            item_name = item.get('name') or item.get('title') or item_id
+
+            filter_results = {}
+            filters_passed_count = 0
+            for j, compiled in enumerate(compiled_rules):
+                passed = bool(masks[j][i])
+                item_value = item[rule_cols[j]]
+                field = compiled['field']
+                filter_results[compiled['name']] = {
+                    'passed': passed,
+                    'detail': self._render_detail(compiled, item_value, passed),
+                    'field': field,
+                    'field_value': item_value,
+                    'rule_type': compiled['rule_type'],
+                    'expected': compiled['expected'],
+                    'actual': f"{field} = {item_value}" if item_value is not None else f"{field} = N/A"
+                }
+                if passed:
+                    filters_passed_count += 1
+
+            evaluations.append({
+                'item_id': item_id,
+                'item_name': item_name,
+                'passed': filters_passed_count == total_filters,
+                'filters_passed_count': filters_passed_count,
+                'total_filters': total_filters,
+                'filter_results': filter_results,
+                'metrics': item
+            })
+
+        return evaluations
+
+    def apply_filters(self, items: List[Dict[str, Any]], step_name: Optional[str] = None,
+                      early_exit: bool = False, as_records: bool = False,
+                      _index_offset: int = 0) -> List[Dict[str, Any]]:
         """
         Apply all filter rules to a list of items.
-        
+
         Args:
             items: List of items to filter
             step_name: Optional step name to get filters for
-        
+            early_exit: Stop evaluating an item's remaining filters at the
+                first failure. filter_results is then partial and
+                filters_passed_count only counts filters seen before the
+                failure, so callers that only need the pass/fail verdict get
+                fewer predicate evaluations. generate_filter_reasoning needs
+                complete results — keep the default there.
+            as_records: Return filter_results values as slotted FilterResult
+                objects instead of dicts — lighter for large in-process runs,
+                but not directly JSON-serializable (use to_dict()).
+
         Returns:
             List of evaluation results with filter results for each item
         """
-        filter_rules = self.get_filters(step_name)
-        
-        if not filter_rules:
+        compiled_rules = self._compile_filters(step_name)
+
+        if not compiled_rules:
             # No filters defined - all items pass
             return [
                 {
-                    'item_id': str(i),
-                    'item_name': item.get('name') or item.get('title') or str(i),
+                    'item_id': str(i + _index_offset),
+                    'item_name': item.get('name') or item.get('title') or str(i + _index_offset),
                     'passed': True,
                     'filter_results': {},
                     'metrics': item
                 }
                 for i, item in enumerate(items)
             ]
-        
+
+        if PANDAS_AVAILABLE and not early_exit and not as_records and len(items) >= _VECTORIZE_MIN_ITEMS:
+            vectorized = self._apply_filters_vectorized(items, compiled_rules, _index_offset)
+            if vectorized is not None:
+                return vectorized
+
+        automatons = self._contains_automatons(step_name)
         evaluations = []
-        
-        for item in items:
-            item_id = item.get('id') or item.get('asin') or str(items.index(item))
+
+        for i, item in enumerate(items):
+            item_id = item.get('id') or item.get('asin') or str(i + _index_offset)
             item_name = item.get('name') or item.get('title') or item_id
-            
+
             filter_results = {}
             all_passed = True
             filters_passed_count = 0
-            
-            for filter_rule in filter_rules:
-                filter_name = filter_rule.get('name', 'unnamed_filter')
-                field = filter_rule.get('field', '')
-                rule_type = filter_rule.get('rule_type', '')
-                value = filter_rule.get('value')
-                min_val = filter_rule.get('min')
-                max_val = filter_rule.get('max')
-                
-                result = self.apply_filter(item, filter_rule)
-                
-                # Get actual item value for the field
-                field_lower = field.lower()
-                matched_field = None
-                item_value = None
-                for key in item.keys():
-                    if key.lower() == field_lower:
-                        matched_field = key
-                        item_value = item[key]
-                        break
-                
-                # Enhance result with field and value information
-                result['field'] = field
-                result['field_value'] = item_value
-                result['rule_type'] = rule_type
-                if rule_type == 'range':
-                    result['expected'] = f"{field} in [{min_val}-{max_val}]"
-                elif rule_type == 'min':
-                    result['expected'] = f"{field} >= {value}"
-                elif rule_type == 'max':
-                    result['expected'] = f"{field} <= {value}"
-                elif rule_type == 'equals':
-                    result['expected'] = f"{field} == {value}"
-                elif rule_type == 'contains':
-                    result['expected'] = f"{field} contains '{value}'"
-                else:
-                    result['expected'] = f"{field} {rule_type} {value if value is not None else ''}"
-                
-                result['actual'] = f"{field} = {item_value}" if item_value is not None else f"{field} = N/A"
-                
-                filter_results[filter_name] = result
-                
-                if result['passed']:
+            key_map = {k.lower(): k for k in item}
+            lower_cache: Dict[str, str] = {}
+
+            # One automaton pass per indexed field replaces M substring scans
+            contains_hits = None
+            if automatons:
+                contains_hits = {}
+                for field_lower, automaton in automatons.items():
+                    matched_field = key_map.get(field_lower)
+                    if matched_field is None:
+                        continue
+                    v = item[matched_field]
+                    v_lower = v.lower() if isinstance(v, str) else str(v).lower()
+                    lower_cache[field_lower] = v_lower
+                    contains_hits[field_lower] = {needle for _, needle in automaton.iter(v_lower)}
+
+            for compiled in compiled_rules:
+                result = self._evaluate_compiled(compiled, item, key_map, lower_cache, as_records,
+                                                 contains_hits)
+                filter_results[compiled['name']] = result
+
+                rule_passed = result.passed if as_records else result['passed']
+                if rule_passed:
                     filters_passed_count += 1
                 else:
                     all_passed = False
-            
+                    if early_exit:
+                        break
+
             evaluations.append({
                 'item_id': item_id,
                 'item_name': item_name,
                 'passed': all_passed,
                 'filters_passed_count': filters_passed_count,
-                'total_filters': len(filter_rules),
+                'total_filters': len(compiled_rules),
                 'filter_results': filter_results,
                 'metrics': item
             })
         
         return evaluations
     
+    def apply_filters_parallel(self, items: List[Dict[str, Any]],
+                               step_name: Optional[str] = None,
+                               max_workers: Optional[int] = None,
+                               chunk_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Apply filters across item chunks on a thread pool.
+
+        Filtering is independent per item, so large lists split into chunks
+        evaluated concurrently and the results concatenate in order. Chunks
+        big enough for the vectorized path spend their time in pandas/NumPy
+        C loops, which release the GIL — that is where the threads actually
+        overlap. Small lists just take the sequential path.
+
+        Args:
+            items: List of items to filter
+            step_name: Optional step name to get filters for
+            max_workers: Thread count (ThreadPoolExecutor default when None)
+            chunk_size: Items per chunk; also the threshold below which the
+                sequential path is used directly
+
+        Returns:
+            Same evaluation list apply_filters returns
+        """
+        if len(items) <= chunk_size:
+            return self.apply_filters(items, step_name=step_name)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        starts = range(0, len(items), chunk_size)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            chunk_results = pool.map(
+                lambda start: self.apply_filters(
+                    items[start:start + chunk_size], step_name=step_name,
+                    _index_offset=start
+                ),
+                starts
+            )
+            evaluations = []
+            for chunk in chunk_results:
+                evaluations.extend(chunk)
+        return evaluations
+
+    def _metric_summary(self, metrics: Dict[str, Any]) -> str:
+        """Format the standard metric fields as ' ($price, rating★, ...)' or ''."""
+        parts = [_METRIC_FORMATTERS[key](metrics[key]) for key in _METRIC_KEYS if key in metrics]
+        return f" ({', '.join(parts)})" if parts else ""
+
+    def _reasoning_key(self, payload: List[Any]) -> Optional[bytes]:
+        """
+        Content-hash cache key for rendered reasoning.
+
+        Reasoning is pure in its inputs and the same step data recurs on
+        UI refreshes and replays, so the rendered strings are cached by a
+        digest of the serialized payload. Returns None (skip the cache)
+        for unhashable/unserializable inputs.
+        """
+        try:
+            if ORJSON_AVAILABLE:
+                blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            else:
+                blob = json.dumps(payload, sort_keys=True).encode('utf-8')
+            return hashlib.blake2b(blob, digest_size=16).digest()
+        except (TypeError, ValueError):
+            return None
+
+    def _reasoning_lookup(self, cache_key: Optional[bytes]) -> Optional[str]:
+        """Fetch a cached reasoning string, refreshing its LRU position."""
+        if cache_key is None:
+            return None
+        cached = self._reasoning_cache.get(cache_key)
+        if cached is not None:
+            self._reasoning_cache.move_to_end(cache_key)
+        return cached
+
+    def _reasoning_store(self, cache_key: Optional[bytes], reasoning: str) -> None:
+        """Store a rendered reasoning string with LRU eviction."""
+        if cache_key is None:
+            return
+        self._reasoning_cache[cache_key] = reasoning
+        if len(self._reasoning_cache) > _REASONING_CACHE_SIZE:
+            self._reasoning_cache.popitem(last=False)
+
     def generate_filter_reasoning(
         self, 
         evaluations: List[Dict[str, Any]], 
@@ -440,51 +1150,85 @@ class RuleConfig:
         Returns:
             Human-readable reasoning string
         """
+        cache_key = self._reasoning_key(['filter', step_name, evaluations])
+        cached = self._reasoning_lookup(cache_key)
+        if cached is not None:
+            return cached
+        reasoning = self._build_filter_reasoning(evaluations, step_name)
+        self._reasoning_store(cache_key, reasoning)
+        return reasoning
+
+    def _build_filter_reasoning(
+        self,
+        evaluations: List[Dict[str, Any]],
+        step_name: Optional[str] = None
+    ) -> str:
+        """Render filter reasoning (uncached path behind generate_filter_reasoning)."""
         filter_rules = self.get_filters(step_name)
         
         if not filter_rules:
             return f"No filters defined for step '{step_name or 'default'}'. All {len(evaluations)} items passed."
         
+        # One pass over evaluations yields the pass tally, the passing items,
+        # and the best partial match used by the no-survivors branch
         total = len(evaluations)
-        passed = sum(1 for e in evaluations if e.get('passed', False))
+        all_passed_items = []
+        max_filters_passed = 0
+        top_partial = None
+        for e in evaluations:
+            if e.get('passed', False):
+                all_passed_items.append(e)
+            fp = e.get('filters_passed_count', 0)
+            if fp > max_filters_passed:
+                max_filters_passed = fp
+                top_partial = e
+        passed = len(all_passed_items)
         failed = total - passed
-        
-        # Build description of filters applied
+        # Per-rule display info doesn't vary per candidate; compute it once
+        rule_display = {}
+        for rule in filter_rules:
+            name = rule.get('name', 'unnamed')
+            field = rule.get('field', '')
+            rule_type = rule.get('rule_type', '')
+            value = rule.get('value')
+            if rule_type == 'equals':
+                comp_str = f"{field} == {value}"
+            elif rule_type == 'min':
+                comp_str = f"{field} >= {value}"
+            elif rule_type == 'max':
+                comp_str = f"{field} <= {value}"
+            elif rule_type == 'range':
+                comp_str = f"{field} in [{rule.get('min')}-{rule.get('max')}]"
+            elif rule_type == 'contains':
+                comp_str = f"{field} contains '{value}'"
+            else:
+                comp_str = f"{name}"
+            rule_display[name] = (field, comp_str)
+
+        # Build description of filters applied; one template dispatch per
+        # rule replaces the if/elif ladder of incremental concatenations
         filter_descriptions = []
         for rule in filter_rules:
             rule_name = rule.get('name', 'unnamed')
             field = rule.get('field', '')
             rule_type = rule.get('rule_type', '')
             description = rule.get('description', '')
-            
-            # Build filter description
-            filter_desc = f"{rule_name} ({field}"
+
+            template = _FILTER_DESC_TEMPLATES.get(rule_type)
             if rule_type == 'range':
-                min_val = rule.get('min')
-                max_val = rule.get('max')
-                if min_val is not None and max_val is not None:
-                    filter_desc += f": {min_val}-{max_val}"
-            elif rule_type == 'min':
-                value = rule.get('value')
-                if value is not None:
-                    filter_desc += f": ≥{value}"
-            elif rule_type == 'max':
-                value = rule.get('value')
-                if value is not None:
-                    filter_desc += f": ≤{value}"
-            elif rule_type == 'equals':
-                value = rule.get('value')
-                if value is not None:
-                    filter_desc += f": =={value}"
-            elif rule_type == 'contains':
-                value = rule.get('value')
-                if value is not None:
-                    filter_desc += f": contains '{value}'"
-            
-            filter_desc += ")"
+                has_threshold = rule.get('min') is not None and rule.get('max') is not None
+            else:
+                has_threshold = rule.get('value') is not None
+            if template and has_threshold:
+                filter_desc = template.format(
+                    name=rule_name, field=field, value=rule.get('value'),
+                    min=rule.get('min'), max=rule.get('max')
+                )
+            else:
+                filter_desc = f"{rule_name} ({field})"
             if description:
                 filter_desc += f" - {description}"
-            
+
             filter_descriptions.append(filter_desc)
         
         # Build main reasoning summary at the top
@@ -495,68 +1239,42 @@ class RuleConfig:
         filter_names_str = ", ".join(filter_names)
         
         if passed > 0:
-            # Get items that passed all filters
-            all_passed_items = [e for e in evaluations if e.get('passed', False)]
             if all_passed_items:
                 # Get top item metrics for context
                 top_item = all_passed_items[0]
-                metrics = top_item.get('metrics', {})
-                metric_strs = []
-                for key in ['price', 'rating', 'reviews', 'value', 'score', 'count']:
-                    if key in metrics:
-                        if key == 'price':
-                            metric_strs.append(f"${metrics[key]:.2f}")
-                        elif key == 'rating':
-                            metric_strs.append(f"{metrics[key]}★")
-                        else:
-                            metric_strs.append(f"{metrics[key]}")
-                
-                metrics_summary = f" ({', '.join(metric_strs)})" if metric_strs else ""
-                
+                metrics_summary = self._metric_summary(top_item.get('metrics', {}))
+
                 reasoning_parts.append(
-                    f"Main Reasoning: {passed} candidate(s) passed all {len(filter_rules)} filter(s): {filter_names_str}. "
+                    _MAIN_REASONING + f"{passed} candidate(s) passed all {len(filter_rules)} filter(s): {filter_names_str}. "
                     f"Top candidate: {top_item.get('item_name', 'Unknown')}{metrics_summary}. "
                     f"All items will be ranked by number of filters passed, then by ranking criteria."
                 )
             else:
                 reasoning_parts.append(
-                    f"Main Reasoning: {passed} candidate(s) passed all {len(filter_rules)} filter(s): {filter_names_str}. "
+                    _MAIN_REASONING + f"{passed} candidate(s) passed all {len(filter_rules)} filter(s): {filter_names_str}. "
                     f"Items ranked by number of filters passed ({len(filter_rules)} total), then by ranking criteria."
                 )
         else:
-            # Find items with highest filter count
-            max_filters_passed = max((e.get('filters_passed_count', 0) for e in evaluations), default=0)
+            # The single pass above tracked the best partial match
             if max_filters_passed > 0:
-                top_items = [e for e in evaluations if e.get('filters_passed_count', 0) == max_filters_passed]
-                top_item = top_items[0] if top_items else None
-                
+                top_item = top_partial
+
                 if top_item:
-                    metrics = top_item.get('metrics', {})
-                    metric_strs = []
-                    for key in ['price', 'rating', 'reviews', 'value', 'score', 'count']:
-                        if key in metrics:
-                            if key == 'price':
-                                metric_strs.append(f"${metrics[key]:.2f}")
-                            elif key == 'rating':
-                                metric_strs.append(f"{metrics[key]}★")
-                            else:
-                                metric_strs.append(f"{metrics[key]}")
-                    
-                    metrics_summary = f" ({', '.join(metric_strs)})" if metric_strs else ""
-                    
+                    metrics_summary = self._metric_summary(top_item.get('metrics', {}))
+
                     reasoning_parts.append(
-                        f"Main Reasoning: No candidates passed all {len(filter_rules)} filter(s): {filter_names_str}. "
+                        _MAIN_REASONING + f"No candidates passed all {len(filter_rules)} filter(s): {filter_names_str}. "
                         f"Top candidate passed {max_filters_passed}/{len(filter_rules)} filters: {top_item.get('item_name', 'Unknown')}{metrics_summary}. "
                         f"Items ranked by number of filters passed ({max_filters_passed} max), then by ranking criteria."
                     )
                 else:
                     reasoning_parts.append(
-                        f"Main Reasoning: No candidates passed all {len(filter_rules)} filter(s): {filter_names_str}. "
+                        _MAIN_REASONING + f"No candidates passed all {len(filter_rules)} filter(s): {filter_names_str}. "
                         f"Items ranked by number of filters passed, then by ranking criteria."
                     )
             else:
                 reasoning_parts.append(
-                    f"Main Reasoning: No candidates passed any of the {len(filter_rules)} filter(s): {filter_names_str}. "
+                    _MAIN_REASONING + f"No candidates passed any of the {len(filter_rules)} filter(s): {filter_names_str}. "
                     f"Items ranked by number of filters passed (0 max), then by ranking criteria."
                 )
         
@@ -571,14 +1289,15 @@ class RuleConfig:
         # Show detailed evaluation for each candidate (similar to user's example)
         reasoning_parts.append("\nCandidates Evaluated:")
         
-        # Sort by filters_passed_count (desc) to show best matches first
-        sorted_evaluations = sorted(
-            evaluations, 
-            key=lambda e: (e.get('filters_passed_count', 0), e.get('item_name', '')),
-            reverse=True
+        # Partial sort: only the top 10 best matches are displayed, so an
+        # O(N log 10) heap select beats sorting the whole list
+        top_evaluations = heapq.nlargest(
+            10,
+            evaluations,
+            key=lambda e: (e.get('filters_passed_count', 0), e.get('item_name', ''))
         )
-        
-        for item in sorted_evaluations[:10]:  # Show top 10
+
+        for display_idx, item in enumerate(top_evaluations):
             item_name = item.get('item_name', 'Unknown')
             filters_passed = item.get('filters_passed_count', 0)
             total_filters = item.get('total_filters', 0)
@@ -593,64 +1312,35 @@ class RuleConfig:
             
             # Get key metrics for display
             metrics = item.get('metrics', {})
-            metric_strs = []
-            for key in ['price', 'rating', 'reviews', 'value', 'score', 'count']:
-                if key in metrics:
-                    if key == 'price':
-                        metric_strs.append(f"${metrics[key]:.2f}")
-                    elif key == 'rating':
-                        metric_strs.append(f"{metrics[key]}★")
-                    else:
-                        metric_strs.append(f"{metrics[key]}")
-            
-            metrics_str = f" ({', '.join(metric_strs)})" if metric_strs else ""
+            metrics_str = self._metric_summary(metrics)
             
             # Build detailed failure reasons with actual field values
             failed_details = []
             passed_details = []
             
+            # Note: this must not reuse the name of the function-level
+            # `passed` total, which the truncation trailer below reads
             for filter_name, result in item.get('filter_results', {}).items():
                 detail = result.get('detail', '')
-                passed = result.get('passed', False)
-                
-                # Extract field name and value from filter rule
-                filter_rule = next((r for r in filter_rules if r.get('name') == filter_name), None)
-                if filter_rule:
-                    field = filter_rule.get('field', '')
-                    rule_type = filter_rule.get('rule_type', '')
-                    value = filter_rule.get('value')
-                    min_val = filter_rule.get('min')
-                    max_val = filter_rule.get('max')
-                    
+                rule_passed = result.get('passed', False)
+
+                display = rule_display.get(filter_name)
+                if display:
+                    field, comp_str = display
+
                     # Get actual item value from metrics
                     item_value = metrics.get(field, 'N/A')
-                    
+
                     # Try to extract from detail if available
                     if item_value == 'N/A' and detail:
                         # Try to parse value from detail string (e.g., "$34.99 is within range...")
-                        import re
-                        # Look for common patterns in detail
                         if field in detail.lower():
                             # Try to extract the value mentioned in detail
-                            value_match = re.search(r'(\$?[\d.]+|[\w]+)', detail)
+                            value_match = _DETAIL_VALUE_RE.search(detail)
                             if value_match:
                                 item_value = value_match.group(1)
-                    
-                    # Build comparison string
-                    if rule_type == 'equals':
-                        comp_str = f"{field} == {value}"
-                    elif rule_type == 'min':
-                        comp_str = f"{field} >= {value}"
-                    elif rule_type == 'max':
-                        comp_str = f"{field} <= {value}"
-                    elif rule_type == 'range':
-                        comp_str = f"{field} in [{min_val}-{max_val}]"
-                    elif rule_type == 'contains':
-                        comp_str = f"{field} contains '{value}'"
-                    else:
-                        comp_str = f"{filter_name}"
-                    
-                    if passed:
+
+                    if rule_passed:
                         passed_details.append(f"{comp_str} (actual: {item_value})")
                     else:
                         failed_details.append(f"{comp_str} (actual: {item_value})")
@@ -672,8 +1362,8 @@ class RuleConfig:
                     status_text = f"Passed {filters_passed}/{total_filters} filters"
             
             # Use tree structure format - determine if this is the last item to show
-            is_last_in_display = (item == sorted_evaluations[min(9, len(sorted_evaluations)-1)]) or (len(sorted_evaluations) <= 10 and item == sorted_evaluations[-1])
-            
+            is_last_in_display = display_idx == len(top_evaluations) - 1
+
             if is_last_in_display:
                 # Last item in the displayed list
                 reasoning_parts.append(
@@ -684,179 +1374,236 @@ class RuleConfig:
         
         if len(evaluations) > 10:
             remaining = len(evaluations) - 10
-            passed_remaining = sum(1 for e in sorted_evaluations[10:] if e.get('passed', False))
+            passed_remaining = passed - sum(1 for e in top_evaluations if e.get('passed', False))
             failed_remaining = remaining - passed_remaining
             reasoning_parts.append(f"  └── ... ({remaining} more: {passed_remaining} passed, {failed_remaining} failed)")
         
         return "\n".join(reasoning_parts)
     
+    def _criteria_desc_for(self, step_name: Optional[str]) -> tuple:
+        """
+        Resolve ranking criteria plus derived display strings for a step.
+
+        The criteria dict, its ', '-joined description, and the primary field
+        name only change when rules reload, so they are cached per step name.
+
+        Returns:
+            (criteria_dict_or_None, criteria_desc, primary_field)
+        """
+        cache_key = step_name.lower() if step_name else None
+        cached = self._criteria_desc_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        ranking_criteria = self.get_ranking_criteria(step_name)
+        criteria_desc = ""
+        primary_field = 'score'
+        if ranking_criteria:
+            # Take the field name straight from the criteria dict instead of
+            # round-tripping it through criteria_desc and re-splitting
+            for key in ('primary', 'secondary', 'tertiary'):
+                if ranking_criteria.get(key):
+                    primary_field = str(ranking_criteria[key]).strip()
+                    break
+            criteria_parts = []
+            if ranking_criteria.get('primary'):
+                criteria_parts.append(f"primary: {ranking_criteria['primary']}")
+            if ranking_criteria.get('secondary'):
+                criteria_parts.append(f"secondary: {ranking_criteria['secondary']}")
+            if ranking_criteria.get('tertiary'):
+                criteria_parts.append(f"tertiary: {ranking_criteria['tertiary']}")
+            criteria_desc = ", ".join(criteria_parts)
+
+        result = (ranking_criteria, criteria_desc, primary_field)
+        self._criteria_desc_cache[cache_key] = result
+        return result
+
     def generate_ranking_reasoning(
         self,
         ranked_candidates: List[Dict[str, Any]],
         selected_item: Optional[Dict[str, Any]] = None,
-        step_name: Optional[str] = None
+        step_name: Optional[str] = None,
+        ranked_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+        detail_level: str = 'full'
     ) -> str:
         """
         Generate automatic reasoning explanation for ranking and selection.
-        
+
         Args:
             ranked_candidates: List of ranked candidates with scores
             selected_item: The selected item (if any)
             step_name: Optional step name for context
-        
+            ranked_by_id: Optional item_id -> candidate index as produced by
+                rank_and_select_with_rules, saving the index rebuild here
+            detail_level: 'full' (default) renders the top-5 breakdown and
+                final recommendation; 'summary' stops after the main reasoning
+
         Returns:
             Human-readable reasoning string
         """
-        ranking_criteria = self.get_ranking_criteria(step_name)
-        
+        # ranked_by_id is derived from ranked_candidates, so it stays out
+        # of the cache key
+        cache_key = self._reasoning_key(
+            ['ranking', step_name, ranked_candidates, selected_item, detail_level])
+        cached = self._reasoning_lookup(cache_key)
+        if cached is not None:
+            return cached
+        reasoning = self._build_ranking_reasoning(
+            ranked_candidates, selected_item, step_name, ranked_by_id, detail_level)
+        self._reasoning_store(cache_key, reasoning)
+        return reasoning
+
+    def _build_ranking_reasoning(
+        self,
+        ranked_candidates: List[Dict[str, Any]],
+        selected_item: Optional[Dict[str, Any]] = None,
+        step_name: Optional[str] = None,
+        ranked_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+        detail_level: str = 'full'
+    ) -> str:
+        """Render ranking reasoning (uncached path behind generate_ranking_reasoning)."""
+        ranking_criteria, criteria_desc, primary_field = self._criteria_desc_for(step_name)
+
         if not ranked_candidates:
             return "No candidates available for ranking."
-        
+
+        n_cands = len(ranked_candidates)
+
         if not ranking_criteria:
             # Default ranking explanation
             if selected_item:
-                return f"Selected '{selected_item.get('name', 'item')}' from {len(ranked_candidates)} candidate(s) using default ranking."
-            return f"Ranked {len(ranked_candidates)} candidate(s) using default criteria."
-        
-        # Build criteria description
-        criteria_parts = []
-        if ranking_criteria.get('primary'):
-            criteria_parts.append(f"primary: {ranking_criteria['primary']}")
-        if ranking_criteria.get('secondary'):
-            criteria_parts.append(f"secondary: {ranking_criteria['secondary']}")
-        if ranking_criteria.get('tertiary'):
-            criteria_parts.append(f"tertiary: {ranking_criteria['tertiary']}")
-        
-        criteria_desc = ", ".join(criteria_parts)
-        
-        # Build main reasoning summary at the top
-        reasoning_parts = []
+                return f"Selected '{selected_item.get('name', 'item')}' from {n_cands} candidate(s) using default ranking."
+            return f"Ranked {n_cands} candidate(s) using default criteria."
         
+        # Resolve the selected candidate once; both the main reasoning and
+        # the final recommendation blocks need the same lookup
+        selected_rank_item = None
+        if selected_item:
+            by_id = ranked_by_id
+            if by_id is None:
+                by_id = {item['item_id']: item for item in ranked_candidates if 'item_id' in item}
+            selected_rank_item = by_id.get(selected_item.get('id'))
+
+        # Build the reasoning incrementally in one buffer instead of
+        # accumulating fragments for a final join
+        buf = io.StringIO()
+
+        def _line(text: str):
+            if buf.tell():
+                buf.write("\n")
+            buf.write(text)
+
         if selected_item:
-            selected_rank_item = next(
-                (item for item in ranked_candidates 
-                 if item.get('item_id') == selected_item.get('id')),
-                None
-            )
-            
             if selected_rank_item:
                 selected_name = selected_item.get('name') or selected_item.get('id', 'Unknown')
-                filters_passed = selected_rank_item.get('filters_passed_count', 0)
-                total_filters = selected_rank_item.get('total_filters', 0)
                 criteria_score = selected_rank_item.get('criteria_score', 0)
                 rank = selected_rank_item.get('rank', 1)
-                
-                # Get filter names that were passed
+
+                # One pass over filter_results yields the passed names and,
+                # when upstream didn't precompute the counts, both tallies
                 filter_results = selected_rank_item.get('filter_results', {})
-                passed_filter_names = [name for name, r in filter_results.items() if r.get('passed', False)]
+                passed_filter_names = [
+                    name for name, r in filter_results.items() if r.get('passed', False)
+                ]
+                passed_filter_names_str = ", ".join(passed_filter_names)
+                filters_passed = selected_rank_item.get('filters_passed_count')
+                if filters_passed is None:
+                    filters_passed = len(passed_filter_names)
+                total_filters = selected_rank_item.get('total_filters')
+                if total_filters is None:
+                    total_filters = len(filter_results)
                 
-                if filters_passed == total_filters and total_filters > 0:
-                    main_reason = (
-                        f"Main Reasoning: Selected '{selected_name}' (Rank #{rank}) because it passed all {total_filters} filters: "
-                        f"{', '.join(passed_filter_names)}. "
-                        f"Ranking score: {criteria_score:.2f} based on {criteria_desc}."
-                    )
-                elif total_filters > 0:
-                    main_reason = (
-                        f"Main Reasoning: Selected '{selected_name}' (Rank #{rank}) because it passed {filters_passed}/{total_filters} filters "
-                        f"({', '.join(passed_filter_names) if passed_filter_names else 'none'}), "
-                        f"which is the highest among items with {filters_passed} filters passed. "
-                        f"Ranking score: {criteria_score:.2f} based on {criteria_desc}."
-                    )
+                # Only the filters clause varies between cases; build it once
+                # and emit a single f-string instead of three full variants
+                if total_filters > 0:
+                    if filters_passed == total_filters:
+                        passed_desc = f"because it passed all {total_filters} filters: {passed_filter_names_str}"
+                    else:
+                        passed_desc = (
+                            f"because it passed {filters_passed}/{total_filters} filters "
+                            f"({passed_filter_names_str or 'none'}), "
+                            f"which is the highest among items with {filters_passed} filters passed"
+                        )
                 else:
-                    main_reason = (
-                        f"Main Reasoning: Selected '{selected_name}' (Rank #{rank}) with ranking score: {criteria_score:.2f} "
-                        f"based on {criteria_desc}."
-                    )
-                
-                reasoning_parts.append(main_reason)
+                    passed_desc = "with"
+                main_reason = (
+                    _MAIN_REASONING + f"Selected '{selected_name}' (Rank #{rank}) {passed_desc}"
+                    f"{'. Ranking score' if total_filters > 0 else ' ranking score'}: "
+                    f"{criteria_score:.2f} based on {criteria_desc}."
+                )
+
+                _line(main_reason)
             else:
-                reasoning_parts.append(
-                    f"Main Reasoning: Ranked {len(ranked_candidates)} candidate(s) by: (1) filters passed, (2) then by criteria: {criteria_desc}"
+                _line(
+                    _MAIN_REASONING + f"Ranked {n_cands} candidate(s) by: (1) filters passed, (2) then by criteria: {criteria_desc}"
                 )
         else:
-            reasoning_parts.append(
-                f"Main Reasoning: Ranked {len(ranked_candidates)} candidate(s) by: (1) filters passed, (2) then by criteria: {criteria_desc}"
+            _line(
+                _MAIN_REASONING + f"Ranked {n_cands} candidate(s) by: (1) filters passed, (2) then by criteria: {criteria_desc}"
             )
-        
-        reasoning_parts.append("")
-        reasoning_parts.append(f"Ranking Details:")
-        
-        # Show top 5 ranked items with filter information
-        top_items = ranked_candidates[:5]
-        for i, item in enumerate(top_items, 1):
-            item_name = item.get('item_name', 'Unknown')
-            filters_passed = item.get('filters_passed_count', 0)
-            total_filters = item.get('total_filters', 0)
-            criteria_score = item.get('criteria_score', item.get('total_score', 0))
-            
-            # Get key metrics for display
-            metrics = item.get('metrics', {})
-            metric_strs = []
-            for key in ['price', 'rating', 'reviews', 'value', 'score', 'count']:
-                if key in metrics:
-                    if key == 'price':
-                        metric_strs.append(f"${metrics[key]:.2f}")
-                    elif key == 'rating':
-                        metric_strs.append(f"{metrics[key]}★")
-                    else:
-                        metric_strs.append(f"{metrics[key]}")
-            
-            metrics_str = f" ({', '.join(metric_strs)})" if metric_strs else ""
-            
-            reasoning_parts.append(
+
+        # Summary callers only read the main reasoning — skip the top-5
+        # breakdown and recommendation rendering entirely
+        if detail_level == 'summary':
+            return buf.getvalue()
+
+        _line("")
+        _line(_RANKING_DETAILS)
+        
+        # Show top 5 ranked items with filter information. Pull the display
+        # columns out of each candidate dict in one pass, then format rows.
+        # Rendered metric strings are kept by item id so the Final
+        # Recommendation block can reuse them (the selected item is usually
+        # rank #1 and was just formatted here).
+        rendered_metrics_by_id = {}
+        top_rows = []
+        for item in ranked_candidates[:5]:
+            metrics_str = self._metric_summary(item.get('metrics', {}))
+            rendered_metrics_by_id[item.get('item_id')] = metrics_str
+            top_rows.append((
+                item.get('item_name', 'Unknown'),
+                item.get('filters_passed_count', 0),
+                item.get('total_filters', 0),
+                item.get('criteria_score', item.get('total_score', 0)),
+                metrics_str
+            ))
+        for i, (item_name, filters_passed, total_filters, criteria_score, metrics_str) in enumerate(top_rows, 1):
+            _line(
                 f"  {i}. {item_name}{metrics_str} - {filters_passed}/{total_filters} filters passed, criteria score: {criteria_score:.2f}"
             )
         
         if selected_item:
             selected_name = selected_item.get('name') or selected_item.get('id', 'Unknown')
-            reasoning_parts.append(f"\nFinal Recommendation:")
-            reasoning_parts.append(f"Selected: {selected_name}")
-            
-            # Find selected item in ranked list
-            selected_rank_item = next(
-                (item for item in ranked_candidates 
-                 if item.get('item_id') == selected_item.get('id')),
-                None
-            )
-            
+            _line(_FINAL_REC)
+            _line(f"Selected: {selected_name}")
+
             if selected_rank_item:
                 filters_passed = selected_rank_item.get('filters_passed_count', 0)
                 total_filters = selected_rank_item.get('total_filters', 0)
                 rank = selected_rank_item.get('rank', 'N/A')
                 criteria_score = selected_rank_item.get('criteria_score', 0)
                 
-                # Get key metrics for display
+                # Get key metrics for display (reuse the top-5 render if present)
                 metrics = selected_rank_item.get('metrics', {})
-                metric_strs = []
-                for key in ['price', 'rating', 'reviews', 'value', 'score', 'count']:
-                    if key in metrics:
-                        if key == 'price':
-                            metric_strs.append(f"${metrics[key]:.2f}")
-                        elif key == 'rating':
-                            metric_strs.append(f"{metrics[key]}★")
-                        else:
-                            metric_strs.append(f"{metrics[key]}")
-                
-                metrics_str = f" ({', '.join(metric_strs)})" if metric_strs else ""
-                
+                metrics_str = rendered_metrics_by_id.get(selected_rank_item.get('item_id'))
+                if metrics_str is None:
+                    metrics_str = self._metric_summary(metrics)
+
                 if filters_passed == total_filters:
                     reason = f"Ranked #{rank} - PASSED ALL {total_filters} FILTERS{metrics_str}"
                     if criteria_desc:
-                        primary_field = criteria_desc.split(',')[0].split(':')[1].strip() if ':' in criteria_desc else 'score'
                         primary_value = metrics.get(primary_field, 'N/A')
                         reason += f", highest {primary_field} ({primary_value})"
                 else:
                     reason = f"Ranked #{rank} - passed {filters_passed}/{total_filters} filters (highest among items with {filters_passed} filters passed){metrics_str}"
                     if criteria_desc:
-                        primary_field = criteria_desc.split(',')[0].split(':')[1].strip() if ':' in criteria_desc else 'score'
                         primary_value = metrics.get(primary_field, 'N/A')
                         reason += f", best {primary_field} ({primary_value})"
                 
-                reasoning_parts.append(f"Reasoning: {reason}")
-                reasoning_parts.append(f"Ranking Score: {criteria_score:.2f}")
-        
-        return "\n".join(reasoning_parts)
+                _line(f"Reasoning: {reason}")
+                _line(f"Ranking Score: {criteria_score:.2f}")
+
+        return buf.getvalue()
     
     def generate_step_reasoning(
         self,
@@ -865,11 +1612,14 @@ class RuleConfig:
         output_data: Optional[Dict[str, Any]] = None,
         evaluations: Optional[List[Dict[str, Any]]] = None,
         ranked_candidates: Optional[List[Dict[str, Any]]] = None,
-        selected_item: Optional[Dict[str, Any]] = None
-    ) -> str:
+        selected_item: Optional[Dict[str, Any]] = None,
+        ranked_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+        lazy: bool = False,
+        detail_level: str = 'full'
+    ) -> Any:
         """
         Generate automatic reasoning for any step based on available data.
-        
+
         Args:
             step_name: Name of the step
             input_data: Input data for the step
@@ -877,19 +1627,63 @@ class RuleConfig:
             evaluations: Filter evaluation results (for filter steps)
             ranked_candidates: Ranked candidates (for ranking steps)
             selected_item: Selected item (for selection steps)
-        
+            ranked_by_id: Optional item_id -> candidate index from the ranker
+            lazy: If True, return a _LazyReasoning that renders on first
+                str() instead of building the text now. Callers that
+                serialize reasoning directly should keep the default.
+            detail_level: 'full' or 'summary'; ranking steps skip the
+                per-candidate breakdown when 'summary'
+
         Returns:
-            Human-readable reasoning string
+            Human-readable reasoning string (or _LazyReasoning when lazy=True)
         """
-        step_lower = step_name.lower()
-        
+        if lazy:
+            return _LazyReasoning(
+                self.generate_step_reasoning, step_name,
+                input_data=input_data, output_data=output_data,
+                evaluations=evaluations, ranked_candidates=ranked_candidates,
+                selected_item=selected_item, ranked_by_id=ranked_by_id,
+                detail_level=detail_level
+            )
+
+        cache_key = self._reasoning_key(
+            ['step', step_name, input_data, output_data, evaluations,
+             ranked_candidates, selected_item, detail_level])
+        cached = self._reasoning_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        reasoning = self._build_step_reasoning(
+            step_name, input_data, output_data, evaluations,
+            ranked_candidates, selected_item, ranked_by_id, detail_level
+        )
+
+        self._reasoning_store(cache_key, reasoning)
+        return reasoning
+
+    def _build_step_reasoning(
+        self,
+        step_name: str,
+        input_data: Optional[Dict[str, Any]] = None,
+        output_data: Optional[Dict[str, Any]] = None,
+        evaluations: Optional[List[Dict[str, Any]]] = None,
+        ranked_candidates: Optional[List[Dict[str, Any]]] = None,
+        selected_item: Optional[Dict[str, Any]] = None,
+        ranked_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+        detail_level: str = 'full'
+    ) -> str:
+        """Render step reasoning (uncached path behind generate_step_reasoning)."""
+        kind = _infer_step_kind(step_name)
+
         # Generate reasoning based on step type
-        if 'filter' in step_lower and evaluations is not None:
+        if kind == 'filter' and evaluations is not None:
             return self.generate_filter_reasoning(evaluations, step_name)
-        
-        elif ('rank' in step_lower or 'select' in step_lower) and ranked_candidates is not None:
-            return self.generate_ranking_reasoning(ranked_candidates, selected_item, step_name)
-        
+
+        elif kind == 'rank' and ranked_candidates is not None:
+            return self.generate_ranking_reasoning(ranked_candidates, selected_item, step_name,
+                                                   ranked_by_id=ranked_by_id,
+                                                   detail_level=detail_level)
+
         # Generic reasoning for other steps
         reasoning_parts = [f"Executed step: {step_name}"]
         
@@ -911,21 +1705,27 @@ class RuleConfig:
             return ""
         
         summary_parts = []
-        
+
         # Common fields to summarize
-        if 'candidates_count' in data:
-            summary_parts.append(f"{data['candidates_count']} candidates")
-        if 'total_evaluated' in data:
-            summary_parts.append(f"{data['total_evaluated']} evaluated")
-        if 'passed' in data:
-            summary_parts.append(f"{data['passed']} passed")
-        if 'failed' in data:
-            summary_parts.append(f"{data['failed']} failed")
+        for key, fmt in _SUMMARY_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                summary_parts.append(fmt(value))
         if 'selected_item' in data:
             item = data['selected_item']
             if item:
                 name = item.get('name') or item.get('id', 'item')
                 summary_parts.append(f"selected: {name}")
-        
-        return ", ".join(summary_parts) if summary_parts else ""
+
+        if summary_parts:
+            return ", ".join(summary_parts)
+
+        # No known fields matched — for small dicts, dump the whole payload
+        # so callers still get useful fallback text
+        if len(data) <= _SUMMARY_DUMP_MAX_KEYS:
+            try:
+                return _dumps(data)
+            except (TypeError, ValueError):
+                pass
+        return ""
 
@@ -4,9 +4,12 @@ Storage layer for X-Ray execution data.
 Provides abstract base class and implementations for different storage backends.
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import islice
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class StorageBackend(ABC):
@@ -74,11 +77,20 @@ class InMemoryStorage(StorageBackend):
     Useful for testing, development, or when persistence isn't needed.
     """
     
-    def __init__(self):
-        """Initialize in-memory storage."""
-        self._executions: Dict[str, Dict[str, Any]] = {}
-        self._execution_order: List[str] = []
-    
+    def __init__(self, max_executions: Optional[int] = None):
+        """
+        Initialize in-memory storage.
+
+        Args:
+            max_executions: Optional cap on retained executions; when set,
+                saving past the cap evicts the oldest execution so memory
+                stays bounded on long-running processes
+        """
+        # One insertion-ordered dict tracks both the data and the order,
+        # making deletes O(1) instead of an O(n) list removal
+        self._executions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._max_executions = max_executions
+
     def save_execution(
         self,
         execution_id: str,
@@ -86,40 +98,56 @@ class InMemoryStorage(StorageBackend):
         steps: List[Dict[str, Any]]
     ):
         """Save execution to memory."""
-        if execution_id not in self._execution_order:
-            self._execution_order.append(execution_id)
-        
+        # The save path records a raw epoch timestamp; the ISO string is
+        # only formatted when an execution is actually read back
         self._executions[execution_id] = {
             "execution_id": execution_id,
             "metadata": metadata,
             "steps": steps,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at_ns": time.time_ns()
         }
-    
+        if self._max_executions is not None and len(self._executions) > self._max_executions:
+            self._executions.popitem(last=False)
+
+    @staticmethod
+    def _with_created_at(exec_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format (and cache) the ISO created_at string on first read."""
+        if "created_at" not in exec_data:
+            exec_data["created_at"] = datetime.fromtimestamp(
+                exec_data["created_at_ns"] / 1e9, tz=timezone.utc
+            ).isoformat()
+        return exec_data
+
     def get_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve execution from memory."""
-        return self._executions.get(execution_id)
-    
+        exec_data = self._executions.get(execution_id)
+        if not exec_data:
+            return None
+        exec_data = self._with_created_at(exec_data)
+        # Shallow copy without the internal raw-timestamp key, keeping the
+        # returned shape identical to the other backends
+        return {
+            "execution_id": exec_data["execution_id"],
+            "metadata": exec_data["metadata"],
+            "steps": exec_data["steps"],
+            "created_at": exec_data["created_at"]
+        }
+
     def list_executions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """List executions from memory."""
-        executions = []
         # Return in reverse order (most recent first)
-        for execution_id in reversed(self._execution_order[-limit:]):
-            exec_data = self._executions.get(execution_id)
-            if exec_data:
-                executions.append({
-                    "execution_id": execution_id,
-                    "metadata": exec_data["metadata"],
-                    "created_at": exec_data["created_at"]
-                })
-        return executions
-    
+        return [
+            {
+                "execution_id": execution_id,
+                "metadata": exec_data["metadata"],
+                "created_at": self._with_created_at(exec_data)["created_at"]
+            }
+            for execution_id, exec_data in islice(reversed(self._executions.items()), limit)
+        ]
+
     def delete_execution(self, execution_id: str):
         """Delete execution from memory."""
-        if execution_id in self._executions:
-            del self._executions[execution_id]
-        if execution_id in self._execution_order:
-            self._execution_order.remove(execution_id)
+        self._executions.pop(execution_id, None)
 
 
 # Export the abstract base and default implementation
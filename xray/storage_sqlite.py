@@ -11,11 +11,113 @@ try:
 except ImportError:
     SQLITE_AVAILABLE = False
 
+import atexit
 import json
+import queue
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from .storage import StorageBackend
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # orjson serializes to bytes; decode so the TEXT columns keep str values
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Zstd frames always start with this magic, which lets reads distinguish
+# compressed blobs from plain JSON rows written before compression existed
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Canonical fields lifted to the top level of returned executions; stripped
+# from the metadata dict on the read paths
+_META_STRIP = frozenset({"name", "started_at", "ended_at", "completed_at"})
+
+if ZSTD_AVAILABLE:
+    _ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+    def _pack(obj: Any) -> bytes:
+        """Serialize and compress a payload for storage."""
+        return _ZSTD_COMPRESSOR.compress(_dumps(obj).encode())
+else:
+    _pack = _dumps
+
+
+def _unpack(value: Any) -> Any:
+    """Deserialize a stored payload, decompressing zstd blobs when present."""
+    if ZSTD_AVAILABLE and isinstance(value, bytes) and value[:4] == _ZSTD_MAGIC:
+        value = _ZSTD_DECOMPRESSOR.decompress(value)
+    return _loads(value)
+
+
+# Timestamps our own save paths produce; matching here skips the defensive
+# parse/reformat chain (and its exception handling) entirely
+_ISO_RE = re.compile(
+    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|\+00:00)?$'
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_timestamp_str(ts: str) -> str:
+    """Normalize a timestamp string to ISO format with a trailing Z (cached)."""
+    if _ISO_RE.match(ts):
+        # Already canonical - just ensure the trailing Z without a
+        # datetime round-trip
+        if ts.endswith('Z'):
+            return ts
+        if ts.endswith('+00:00'):
+            return ts[:-6] + 'Z'
+        return ts + 'Z'
+    try:
+        if 'Z' in ts or '+' in ts or ts.count(':') >= 2:
+            ts_clean = ts.replace('Z', '').replace('+00:00', '')
+            if '+' in ts_clean:
+                # Has timezone offset
+                ts_clean = ts_clean.split('+')[0]
+            try:
+                dt = datetime.fromisoformat(ts_clean)
+            except ValueError:
+                # Try with just date and time
+                if 'T' in ts_clean:
+                    date_part, time_part = ts_clean.split('T')
+                    dt = datetime.fromisoformat(f"{date_part}T{time_part.split('.')[0]}")
+                else:
+                    dt = datetime.fromisoformat(ts_clean)
+        else:
+            dt = datetime.fromisoformat(ts)
+        return dt.isoformat() + "Z"
+    except Exception:
+        # If parsing fails, return as-is
+        return ts
+
+
+def _normalize_timestamp(ts: Any) -> Optional[str]:
+    """Normalize a timestamp of any supported type to an ISO string with Z."""
+    if not ts:
+        return None
+    if isinstance(ts, str):
+        return _normalize_timestamp_str(ts)
+    return ts.isoformat() + "Z" if hasattr(ts, 'isoformat') else str(ts)
+
 
 class SQLiteStorage(StorageBackend):
     """
@@ -24,27 +126,142 @@ class SQLiteStorage(StorageBackend):
     Provides persistent file-based storage. SQLite is included with Python,
     so no additional dependencies are required.
     """
-    
-    def __init__(self, db_path: str = "xray.db"):
+
+    # Hot-path SQL as class constants: passing the identical string object
+    # on every call keeps the driver's prepared-statement cache hitting
+    _SQL_INSERT_EXECUTION = """
+        INSERT OR REPLACE INTO executions (execution_id, metadata, created_at)
+        VALUES (?, ?, ?)
+    """
+    _SQL_DELETE_STEPS = "DELETE FROM steps WHERE execution_id = ?"
+    _SQL_INSERT_STEP = """
+        INSERT INTO steps (execution_id, step_order, step_data)
+        VALUES (?, ?, ?)
+    """
+    _SQL_GET_EXECUTION = """
+        SELECT e.metadata, e.created_at, s.step_data
+        FROM executions e
+        LEFT JOIN steps s ON s.execution_id = e.execution_id
+        WHERE e.execution_id = ?
+        ORDER BY s.step_order
+    """
+    _SQL_LIST_EXECUTIONS = """
+        SELECT execution_id, metadata, created_at
+        FROM executions
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+
+    # Write-behind batching limits: drain at most this many queued saves
+    # into one transaction
+    _WRITE_BATCH_MAX = 500
+
+    # Decoded workflows kept per instance; evicted LRU beyond this
+    _WORKFLOW_CACHE_SIZE = 256
+
+    def __init__(self, db_path: str = "xray.db", write_behind: bool = False):
         """
         Initialize SQLite storage.
-        
+
         Args:
             db_path: Path to SQLite database file
+            write_behind: When True, save_execution enqueues writes for a
+                background thread that groups them into batched commits,
+                amortizing fsync cost across bursts of saves. Reads issued
+                right after an asynchronous save may not see it yet; call
+                flush() first when that matters.
         """
         if not SQLITE_AVAILABLE:
             raise ImportError(
                 "SQLite is not available. This is unusual as SQLite "
                 "is included with Python. Please check your Python installation."
             )
-        
+
         self.db_path = db_path
+        self._local = threading.local()
+        self._write_behind = write_behind
+        if write_behind:
+            self._write_q: "queue.Queue" = queue.Queue()
+            self._writer_stop = threading.Event()
+            self._writer = threading.Thread(
+                target=self._drain_writes, daemon=True
+            )
+            self._writer.start()
+            # Drain pending writes on interpreter shutdown
+            atexit.register(self.flush)
+        # Decoded workflow dicts keyed by id, validated against updated_at
+        self._workflow_cache: "OrderedDict[str, tuple]" = OrderedDict()
         self._init_db()
-    
+
+    def _configure_connection(self, conn):
+        """Apply per-connection pragmas."""
+        try:
+            # WAL lets readers proceed while a writer commits, provided each
+            # thread has its own connection handle
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL makes NORMAL durability safe for this workload and skips
+            # one fsync per commit; temp structures and a larger page cache
+            # (64MB, negative value = KiB) stay in memory
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            # Memory-map up to 256MB of the file so reads skip a userspace copy
+            conn.execute("PRAGMA mmap_size=268435456")
+        except sqlite3.Error:
+            # Older SQLite builds or read-only filesystems - keep defaults
+            pass
+
+    def _get_conn(self) -> "sqlite3.Connection":
+        """
+        Get the connection for the current thread, creating it on first use.
+
+        sqlite3 connections are not safe to share across threads, and under
+        WAL each reader needs its own handle to run concurrently, so one
+        long-lived connection is kept per thread instead of opening and
+        closing a connection on every call.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=512
+            )
+            self._configure_connection(conn)
+            self._local.conn = conn
+            self._local.cursor = None
+        return conn
+
+    def _get_cursor(self) -> "sqlite3.Cursor":
+        """Get a long-lived cursor for the current thread's connection."""
+        conn = self._get_conn()
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = conn.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    def flush(self):
+        """Block until all queued write-behind saves have been committed."""
+        if self._write_behind:
+            self._write_q.join()
+
+    def close(self):
+        """Close the current thread's connection (if any)."""
+        if self._write_behind:
+            self.flush()
+            self._writer_stop.set()
+            self._writer.join(timeout=1.0)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            self._local.cursor = None
+
     def _init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._get_conn()
+        cursor = self._get_cursor()
         
         # Executions table
         cursor.execute("""
@@ -72,6 +289,13 @@ class SQLiteStorage(StorageBackend):
             ON steps(execution_id, step_order)
         """)
         
+        # Covering index so list_executions reads newest-first straight off
+        # the index instead of scanning and sorting the table
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_executions_created
+            ON executions(created_at DESC, execution_id)
+        """)
+
         # Workflows table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS workflows (
@@ -87,59 +311,130 @@ class SQLiteStorage(StorageBackend):
             CREATE INDEX IF NOT EXISTS idx_workflows_updated 
             ON workflows(updated_at DESC)
         """)
-        
+
         conn.commit()
-        conn.close()
     
     def save_execution(
         self,
         execution_id: str,
         metadata: Dict[str, Any],
-        steps: List[Dict[str, Any]]
+        steps: List[Dict[str, Any]],
+        sync: bool = False
     ):
         """
         Save execution to SQLite database.
-        
+
         Accepts either canonical format or legacy format and normalizes it.
+        With write_behind enabled the save is queued and committed by the
+        background writer; pass sync=True to block until it is durable.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        # Save execution metadata as-is; nothing below mutates it, so
+        # there is no need to copy
+        # Use started_at from metadata if available, otherwise use current time
+        started_at = metadata.get("started_at") or datetime.utcnow().isoformat()
+
+        # Serialize outside the writer so the background thread does no
+        # JSON work while holding the write transaction open; steps that
+        # are already serialized strings/bytes are stored as-is
+        op = (
+            execution_id,
+            _pack(metadata),
+            started_at,
+            [
+                (execution_id, order, step if isinstance(step, (str, bytes)) else _pack(step))
+                for order, step in enumerate(steps)
+            ]
+        )
+        self._submit_op(op, sync)
+
+    def save_execution_raw(
+        self,
+        execution_id: str,
+        metadata_json: Any,
+        step_jsons: List[Any],
+        started_at: Optional[str] = None,
+        sync: bool = False
+    ):
+        """
+        Save an execution whose payloads are already serialized JSON.
+
+        Skips all Python-level JSON work - useful when replaying or
+        importing executions that arrive as canonical JSON strings/bytes.
+
+        Args:
+            execution_id: Unique execution identifier
+            metadata_json: Serialized metadata (str or bytes)
+            step_jsons: Serialized step documents, in order
+            started_at: Optional ISO timestamp; defaults to now
+            sync: Block until durable when write_behind is enabled
+        """
+        op = (
+            execution_id,
+            metadata_json,
+            started_at or datetime.utcnow().isoformat(),
+            [(execution_id, order, step) for order, step in enumerate(step_jsons)]
+        )
+        self._submit_op(op, sync)
+
+    def _submit_op(self, op, sync: bool):
+        """Queue a serialized save when write-behind is on, else commit inline."""
+        if self._write_behind:
+            self._write_q.put(op)
+            if sync:
+                self.flush()
+            return
+
+        self._apply_write_batch([op])
+
+    def _apply_write_batch(self, ops):
+        """Commit a batch of serialized save operations in one transaction."""
+        conn = self._get_conn()
+        cursor = self._get_cursor()
+
         try:
-            # Normalize metadata - extract canonical fields if present
-            # If metadata contains canonical fields, extract them
-            normalized_metadata = metadata.copy()
-            
-            # Save execution metadata
-            # Use started_at from metadata if available, otherwise use current time
-            started_at = normalized_metadata.get("started_at") or datetime.utcnow().isoformat()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO executions (execution_id, metadata, created_at)
-                VALUES (?, ?, ?)
-            """, (
-                execution_id,
-                json.dumps(normalized_metadata),
-                started_at
-            ))
-            
-            # Delete existing steps for this execution
-            cursor.execute("DELETE FROM steps WHERE execution_id = ?", (execution_id,))
-            
-            # Save steps (already in canonical format from core.py)
-            for order, step in enumerate(steps):
-                cursor.execute("""
-                    INSERT INTO steps (execution_id, step_order, step_data)
-                    VALUES (?, ?, ?)
-                """, (
+            for execution_id, metadata_blob, started_at, step_rows in ops:
+                cursor.execute(self._SQL_INSERT_EXECUTION, (
                     execution_id,
-                    order,
-                    json.dumps(step)
+                    metadata_blob,
+                    started_at
                 ))
-            
+
+                # Delete existing steps for this execution
+                cursor.execute(self._SQL_DELETE_STEPS, (execution_id,))
+
+                # Save steps (already in canonical format from core.py) in
+                # one batched statement instead of a round-trip per step
+                cursor.executemany(self._SQL_INSERT_STEP, step_rows)
+
             conn.commit()
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _drain_writes(self):
+        """Background loop grouping queued saves into batched commits."""
+        while True:
+            try:
+                op = self._write_q.get(timeout=0.05)
+            except queue.Empty:
+                if self._writer_stop.is_set():
+                    break
+                continue
+
+            ops = [op]
+            while len(ops) < self._WRITE_BATCH_MAX:
+                try:
+                    ops.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._apply_write_batch(ops)
+            except Exception as e:
+                print(f"Warning: write-behind batch of {len(ops)} save(s) failed: {e}")
+            finally:
+                for _ in ops:
+                    self._write_q.task_done()
     
     def get_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -156,256 +451,240 @@ class SQLiteStorage(StorageBackend):
                 "steps": [...]
             }
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # Get execution metadata
-            cursor.execute("""
-                SELECT metadata, created_at FROM executions WHERE execution_id = ?
-            """, (execution_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
-            
-            metadata_json, created_at = row
-            metadata = json.loads(metadata_json)
-            
-            # Get steps
-            cursor.execute("""
-                SELECT step_data FROM steps 
-                WHERE execution_id = ? 
-                ORDER BY step_order
-            """, (execution_id,))
-            
-            steps = [json.loads(row[0]) for row in cursor.fetchall()]
-            
-            # Build canonical format
-            # Extract name from metadata if available (check multiple possible keys)
-            name = (metadata.get("name") or 
-                   metadata.get("execution_name") or 
-                   metadata.get("workflow") or 
-                   metadata.get("workflow_name") or 
-                   "unnamed_execution")
-            
-            # Extract timestamps
-            started_at = metadata.get("started_at") or created_at
-            ended_at = metadata.get("ended_at") or metadata.get("completed_at")
-            
-            # If steps exist, use their timestamps to infer execution times
-            if steps and not ended_at:
-                last_step = steps[-1]
-                if "ended_at" in last_step:
-                    ended_at = last_step["ended_at"]
-                elif "timestamp" in last_step:
-                    ended_at = last_step["timestamp"]
-            
-            # Normalize timestamps to ISO format with Z
-            def normalize_timestamp(ts):
-                if not ts:
-                    return None
-                if isinstance(ts, str):
-                    # Handle various timestamp formats
-                    try:
-                        # Try parsing with timezone
-                        if 'Z' in ts or '+' in ts or ts.count(':') >= 2:
-                            # Remove Z and try parsing
-                            ts_clean = ts.replace('Z', '').replace('+00:00', '')
-                            if '+' in ts_clean:
-                                # Has timezone offset
-                                parts = ts_clean.split('+')
-                                ts_clean = parts[0]
-                            try:
-                                dt = datetime.fromisoformat(ts_clean)
-                            except:
-                                # Try with just date and time
-                                if 'T' in ts_clean:
-                                    date_part, time_part = ts_clean.split('T')
-                                    dt = datetime.fromisoformat(f"{date_part}T{time_part.split('.')[0]}")
-                                else:
-                                    dt = datetime.fromisoformat(ts_clean)
-                        else:
-                            dt = datetime.fromisoformat(ts)
-                        return dt.isoformat() + "Z"
-                    except Exception as e:
-                        # If parsing fails, return as-is or current time
-                        return datetime.utcnow().isoformat() + "Z"
-                return ts.isoformat() + "Z" if hasattr(ts, 'isoformat') else str(ts)
-            
-            return {
-                "id": execution_id,
-                "name": name,
-                "started_at": normalize_timestamp(started_at) or datetime.utcnow().isoformat() + "Z",
-                "ended_at": normalize_timestamp(ended_at) or datetime.utcnow().isoformat() + "Z",
-                "metadata": {k: v for k, v in metadata.items() if k not in ["name", "started_at", "ended_at", "completed_at"]},
-                "steps": steps
-            }
-        finally:
-            conn.close()
+        cursor = self._get_cursor()
+
+        # Fetch metadata and steps in a single joined query instead of
+        # two sequential round-trips; step_data is NULL when an
+        # execution has no steps
+        cursor.execute(self._SQL_GET_EXECUTION, (execution_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        metadata_json, created_at, first_step = row
+        metadata = _unpack(metadata_json)
+
+        steps = [] if first_step is None else [_unpack(first_step)]
+        steps.extend(_unpack(step_row[2]) for step_row in cursor)
+
+        execution = self._canonical_header(execution_id, metadata, created_at,
+                                           steps[-1] if steps else None)
+        execution["steps"] = steps
+        return execution
+
+    @staticmethod
+    def _canonical_header(execution_id: str, metadata: Dict[str, Any],
+                          created_at: Any,
+                          last_step: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the canonical execution document minus its steps array.
+
+        Shared by get_execution and get_execution_raw_json so both read
+        paths emit one shape. last_step is only consulted to infer
+        ended_at when the metadata has no end timestamp.
+        """
+        # Extract name from metadata if available (check multiple possible keys)
+        name = (metadata.get("name") or
+               metadata.get("execution_name") or
+               metadata.get("workflow") or
+               metadata.get("workflow_name") or
+               "unnamed_execution")
+
+        # Extract timestamps
+        started_at = metadata.get("started_at") or created_at
+        ended_at = metadata.get("ended_at") or metadata.get("completed_at")
+
+        # If steps exist, use their timestamps to infer execution times
+        if last_step and not ended_at:
+            if "ended_at" in last_step:
+                ended_at = last_step["ended_at"]
+            elif "timestamp" in last_step:
+                ended_at = last_step["timestamp"]
+
+        return {
+            "id": execution_id,
+            "name": name,
+            "started_at": _normalize_timestamp(started_at) or datetime.utcnow().isoformat() + "Z",
+            "ended_at": _normalize_timestamp(ended_at) or datetime.utcnow().isoformat() + "Z",
+            "metadata": {k: v for k, v in metadata.items() if k not in _META_STRIP}
+        }
     
+    def get_execution_raw_json(self, execution_id: str) -> Optional[bytes]:
+        """
+        Retrieve an execution as a ready-to-serve JSON document.
+
+        Emits the same canonical shape as get_execution, but splices the
+        stored step JSON into the document verbatim, so serving an
+        execution over HTTP skips the Python-level parse of every step
+        only to re-serialize it. Compressed rows fall back to get_execution
+        plus a dump.
+
+        Returns:
+            UTF-8 encoded JSON bytes, or None if the execution is missing.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(self._SQL_GET_EXECUTION, (execution_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        metadata_json, created_at, first_step = row
+        step_blobs = [] if first_step is None else [first_step]
+        step_blobs.extend(step_row[2] for step_row in cursor)
+
+        if any(isinstance(blob, bytes) for blob in step_blobs):
+            # Compressed steps have to be unpacked anyway - take the
+            # canonical dict path
+            execution = self.get_execution(execution_id)
+            return _dumps(execution).encode() if execution is not None else None
+
+        metadata = _unpack(metadata_json)
+        # ended_at inference only ever looks at the last step
+        last_step = _loads(step_blobs[-1]) if step_blobs else None
+        header = self._canonical_header(execution_id, metadata, created_at, last_step)
+
+        # Splice the raw step documents into the serialized header
+        head = _dumps(header)
+        return (head[:-1] + ',"steps":[' + ",".join(step_blobs) + "]}").encode()
+
     def list_executions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         List executions from SQLite database in canonical format.
         
         Returns list of execution summaries with canonical structure.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT execution_id, metadata, created_at 
-                FROM executions 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """, (limit,))
-            
-            executions = []
-            for row in cursor.fetchall():
-                execution_id, metadata_json, created_at = row
-                metadata = json.loads(metadata_json)
-                
-                # Build canonical format summary
-                name = (metadata.get("name") or 
-                       metadata.get("execution_name") or 
-                       metadata.get("workflow") or 
-                       metadata.get("workflow_name") or 
-                       "unnamed_execution")
-                started_at = metadata.get("started_at") or created_at
-                ended_at = metadata.get("ended_at") or metadata.get("completed_at")
-                
-                # Normalize timestamps
-                def normalize_timestamp(ts):
-                    if not ts:
-                        return None
-                    if isinstance(ts, str):
-                        try:
-                            ts_clean = ts.replace('Z', '').replace('+00:00', '')
-                            if '+' in ts_clean:
-                                ts_clean = ts_clean.split('+')[0]
-                            try:
-                                dt = datetime.fromisoformat(ts_clean)
-                            except:
-                                if 'T' in ts_clean:
-                                    date_part, time_part = ts_clean.split('T')
-                                    dt = datetime.fromisoformat(f"{date_part}T{time_part.split('.')[0]}")
-                                else:
-                                    dt = datetime.fromisoformat(ts_clean)
-                            return dt.isoformat() + "Z"
-                        except:
-                            return ts
-                    return ts.isoformat() + "Z" if hasattr(ts, 'isoformat') else str(ts)
-                
-                executions.append({
-                    "id": execution_id,
-                    "name": name,
-                    "started_at": normalize_timestamp(started_at) or created_at,
-                    "ended_at": normalize_timestamp(ended_at),
-                    "metadata": {k: v for k, v in metadata.items() if k not in ["name", "started_at", "ended_at", "completed_at"]},
-                    "steps": []  # Summary doesn't include steps
-                })
-            
-            return executions
-        finally:
-            conn.close()
+        cursor = self._get_cursor()
+
+        cursor.execute(self._SQL_LIST_EXECUTIONS, (limit,))
+
+        executions = []
+        for row in cursor:
+            execution_id, metadata_json, created_at = row
+            metadata = _unpack(metadata_json)
+
+            # Build canonical format summary
+            name = (metadata.get("name") or
+                   metadata.get("execution_name") or
+                   metadata.get("workflow") or
+                   metadata.get("workflow_name") or
+                   "unnamed_execution")
+            started_at = metadata.get("started_at") or created_at
+            ended_at = metadata.get("ended_at") or metadata.get("completed_at")
+
+            executions.append({
+                "id": execution_id,
+                "name": name,
+                "started_at": _normalize_timestamp(started_at) or created_at,
+                "ended_at": _normalize_timestamp(ended_at),
+                "metadata": {k: v for k, v in metadata.items() if k not in _META_STRIP},
+                "steps": []  # Summary doesn't include steps
+            })
+
+        return executions
     
     def delete_execution(self, execution_id: str):
         """Delete execution from SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._get_conn()
+        cursor = self._get_cursor()
         
         try:
             cursor.execute("DELETE FROM steps WHERE execution_id = ?", (execution_id,))
             cursor.execute("DELETE FROM executions WHERE execution_id = ?", (execution_id,))
             conn.commit()
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
     
     def save_workflow(self, workflow_id: str, workflow_data: Dict[str, Any]):
         """Save workflow to SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._get_conn()
+        cursor = self._get_cursor()
         
         try:
             now = datetime.utcnow().isoformat()
-            
-            # Check if workflow exists
-            cursor.execute("SELECT workflow_id FROM workflows WHERE workflow_id = ?", (workflow_id,))
-            exists = cursor.fetchone()
-            
-            if exists:
-                # Update existing workflow
-                cursor.execute("""
-                    UPDATE workflows 
-                    SET workflow_data = ?, updated_at = ?
-                    WHERE workflow_id = ?
-                """, (json.dumps(workflow_data), now, workflow_id))
-            else:
-                # Insert new workflow
-                cursor.execute("""
-                    INSERT INTO workflows (workflow_id, workflow_data, created_at, updated_at)
-                    VALUES (?, ?, ?, ?)
-                """, (workflow_id, json.dumps(workflow_data), now, now))
-            
+
+            # Single upsert replaces the old SELECT-then-UPDATE/INSERT
+            # branch; existing rows keep their original created_at
+            cursor.execute("""
+                INSERT INTO workflows (workflow_id, workflow_data, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(workflow_id) DO UPDATE SET
+                    workflow_data = excluded.workflow_data,
+                    updated_at = excluded.updated_at
+            """, (workflow_id, _pack(workflow_data), now, now))
+
             conn.commit()
-        finally:
-            conn.close()
+            self._workflow_cache.pop(workflow_id, None)
+        except Exception:
+            conn.rollback()
+            raise
     
     def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
-        """Get workflow from SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT workflow_data FROM workflows WHERE workflow_id = ?
-            """, (workflow_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
-            
-            return json.loads(row[0])
-        finally:
-            conn.close()
+        """
+        Get workflow from SQLite database.
+
+        Repeat reads of an unchanged workflow return a cached decoded dict
+        (validated against updated_at); treat the result as read-only.
+        """
+        cursor = self._get_cursor()
+
+        cursor.execute("""
+            SELECT workflow_data, updated_at FROM workflows WHERE workflow_id = ?
+        """, (workflow_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        workflow_blob, updated_at = row
+
+        cached = self._workflow_cache.get(workflow_id)
+        if cached is not None and cached[0] == updated_at:
+            self._workflow_cache.move_to_end(workflow_id)
+            return cached[1]
+
+        workflow_data = _unpack(workflow_blob)
+        self._workflow_cache[workflow_id] = (updated_at, workflow_data)
+        if len(self._workflow_cache) > self._WORKFLOW_CACHE_SIZE:
+            self._workflow_cache.popitem(last=False)
+        return workflow_data
     
     def list_workflows(self) -> List[Dict[str, Any]]:
         """List all workflows from SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT workflow_id, workflow_data, updated_at 
-                FROM workflows 
-                ORDER BY updated_at DESC
-            """)
-            
-            workflows = []
-            for row in cursor.fetchall():
-                workflow_id, workflow_data_json, updated_at = row
-                workflow_data = json.loads(workflow_data_json)
-                
-                workflows.append({
-                    "workflow_id": workflow_id,
-                    "name": workflow_data.get("name", "Unnamed"),
-                    "steps_count": len(workflow_data.get("steps", [])),
-                    "updated_at": updated_at
-                })
-            
-            return workflows
-        finally:
-            conn.close()
+        cursor = self._get_cursor()
+
+        cursor.execute("""
+            SELECT workflow_id, workflow_data, updated_at
+            FROM workflows
+            ORDER BY updated_at DESC
+        """)
+
+        workflows = []
+        for row in cursor:
+            workflow_id, workflow_data_json, updated_at = row
+            workflow_data = _unpack(workflow_data_json)
+
+            workflows.append({
+                "workflow_id": workflow_id,
+                "name": workflow_data.get("name", "Unnamed"),
+                "steps_count": len(workflow_data.get("steps", [])),
+                "updated_at": updated_at
+            })
+
+        return workflows
     
     def delete_workflow(self, workflow_id: str):
         """Delete workflow from SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._get_conn()
+        cursor = self._get_cursor()
         
         try:
             cursor.execute("DELETE FROM workflows WHERE workflow_id = ?", (workflow_id,))
             conn.commit()
-        finally:
-            conn.close()
+            self._workflow_cache.pop(workflow_id, None)
+        except Exception:
+            conn.rollback()
+            raise
 
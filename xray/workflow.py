@@ -3,10 +3,26 @@ High-level workflow functions for X-Ray library.
 Provides convenient functions for common multi-step workflows using RuleConfig.
 """
 
+import heapq
 from typing import Dict, Any, List, Optional
 from xray import XRay
 from xray.rules import RuleConfig
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this many candidates the NumPy conversion overhead outweighs the
+# vectorized arithmetic
+_NUMPY_MIN_ITEMS = 200
+
+
+def _rank_key(item: Dict[str, Any]) -> tuple:
+    """Sort key for ranked candidates: all-passed flag, passes, then score."""
+    return (item['passed_all'], item['filters_passed_count'], item['criteria_score'])
+
 
 def apply_filters_with_rules(
     candidates: List[Dict[str, Any]], 
@@ -33,14 +49,18 @@ def apply_filters_with_rules(
             - failed: Number that failed
     """
     evaluations = rules.apply_filters(candidates, step_name=step_name)
-    
-    qualified = [c for c, e in zip(candidates, evaluations) if e['passed']]
-    
+
+    # Collect qualified candidates in one pass with the append bound
+    # locally, instead of re-zipping the lists a second time downstream
+    qualified = []
+    qualified_append = qualified.append
+    for candidate, evaluation in zip(candidates, evaluations):
+        if evaluation['passed']:
+            qualified_append(candidate)
+
     # Get filter definitions for display
-    filter_rules = rules.get_filters(step_name)
-    filters_applied = {}
-    for rule in filter_rules:
-        filters_applied[rule.get('name', 'unnamed')] = {
+    filters_applied = {
+        rule.get('name', 'unnamed'): {
             'field': rule.get('field'),
             'rule_type': rule.get('rule_type'),
             'value': rule.get('value'),
@@ -48,7 +68,9 @@ def apply_filters_with_rules(
             'max': rule.get('max'),
             'description': rule.get('description', '')
         }
-    
+        for rule in rules.get_filters(step_name)
+    }
+
     return {
         'evaluations': evaluations,
         'qualified_candidates': qualified,
@@ -63,21 +85,25 @@ def rank_and_select_with_rules(
     evaluations: List[Dict[str, Any]], 
     rules: RuleConfig, 
     step_name: Optional[str] = None,
-    reference: Optional[Dict[str, Any]] = None
+    reference: Optional[Dict[str, Any]] = None,
+    top_k: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Rank and select using RuleConfig criteria (domain-agnostic).
     Ranks ALL items by: (1) number of filters passed, (2) then by ranking criteria.
-    
+
     Args:
         evaluations: List of evaluation results from filtering step
         rules: RuleConfig instance with ranking criteria
         step_name: Optional step name to get ranking criteria for
         reference: Optional reference item for relative ranking
-        
+        top_k: Optional cap on returned candidates; uses a partial sort
+            (O(N log K) instead of O(N log N)) when only the top K matter
+
     Returns:
         Dictionary with:
             - ranked_candidates: List of ranked candidates with scores
+            - ranked_by_id: item_id -> ranked candidate index for O(1) lookups
             - selection: Selected item info
             - selected_item: Full selected item data
             - ranking_criteria: Criteria used for ranking
@@ -87,6 +113,7 @@ def rank_and_select_with_rules(
             'selected_item': None,
             'reason': 'No candidates to rank',
             'ranked_candidates': [],
+            'ranked_by_id': {},
             'selection': {},
             'ranking_criteria': {}
         }
@@ -101,35 +128,71 @@ def rank_and_select_with_rules(
     secondary = ranking_criteria.get('secondary')
     tertiary = ranking_criteria.get('tertiary')
     
+    # Resolve criteria values and normalization maxima once up front;
+    # recomputing the maxima inside the per-item loop made ranking O(N^2).
+    # A lowercase key index built from the first item resolves each field
+    # name once instead of scanning every dict's keys per lookup.
+    all_candidates = [e.get('metrics', {}) for e in evaluations]
+    key_map = _build_lower_key_map(all_candidates[0]) if all_candidates else {}
+    primary_vals = [_get_field_value_case_insensitive(c, primary, 0, key_map) for c in all_candidates] if primary else None
+    secondary_vals = [_get_field_value_case_insensitive(c, secondary, 0, key_map) for c in all_candidates] if secondary else None
+    tertiary_vals = [_get_field_value_case_insensitive(c, tertiary, 0, key_map) for c in all_candidates] if tertiary else None
+
+    max_primary = max(primary_vals) if primary_vals else 1
+    max_secondary = max(secondary_vals) if secondary_vals else 1
+    max_tertiary = max(tertiary_vals) if tertiary_vals else 1
+
+    # For large batches, normalize all three score columns in NumPy at once;
+    # non-numeric field values fall back to the per-item Python path below
+    score_columns = None
+    if NUMPY_AVAILABLE and len(evaluations) >= _NUMPY_MIN_ITEMS:
+        try:
+            n = len(evaluations)
+
+            def _norm_column(vals):
+                if vals is None:
+                    return np.zeros(n)
+                arr = np.asarray(vals, dtype=float)
+                peak = arr.max()
+                return arr / peak if peak > 0 else np.zeros(n)
+
+            p_scores = _norm_column(primary_vals)
+            s_scores = _norm_column(secondary_vals)
+            t_scores = _norm_column(tertiary_vals)
+            score_columns = (p_scores, s_scores, t_scores,
+                             p_scores * 0.5 + s_scores * 0.3 + t_scores * 0.2)
+        except (TypeError, ValueError):
+            score_columns = None
+
     ranked = []
-    
-    for eval_item in evaluations:
-        candidate = eval_item.get('metrics', {})
+
+    for idx, eval_item in enumerate(evaluations):
+        candidate = all_candidates[idx]
         filters_passed = eval_item.get('filters_passed_count', 0)
         total_filters = eval_item.get('total_filters', 0)
-        
-        # Get values for ranking (flexible field access - case-insensitive)
-        primary_val = _get_field_value_case_insensitive(candidate, primary, 0)
-        secondary_val = _get_field_value_case_insensitive(candidate, secondary, 0) if secondary else 0
-        tertiary_val = _get_field_value_case_insensitive(candidate, tertiary, 0) if tertiary else 0
-        
-        # Normalize scores (0-1 scale) - only for items that have the field
-        all_candidates = [e.get('metrics', {}) for e in evaluations]
-        max_primary = max(_get_field_value_case_insensitive(c, primary, 0) for c in all_candidates) if primary else 1
-        primary_score = primary_val / max_primary if max_primary > 0 else 0
-        
-        max_secondary = max(_get_field_value_case_insensitive(c, secondary, 0) for c in all_candidates) if secondary else 1
-        secondary_score = secondary_val / max_secondary if max_secondary > 0 else 0
-        
-        max_tertiary = max(_get_field_value_case_insensitive(c, tertiary, 0) for c in all_candidates) if tertiary else 1
-        tertiary_score = tertiary_val / max_tertiary if max_tertiary > 0 else 0
-        
-        # Weighted score for ranking criteria
-        criteria_score = (
-            primary_score * 0.5 +
-            secondary_score * 0.3 +
-            tertiary_score * 0.2
-        )
+
+        if score_columns is not None:
+            primary_score = float(score_columns[0][idx])
+            secondary_score = float(score_columns[1][idx])
+            tertiary_score = float(score_columns[2][idx])
+            criteria_score = float(score_columns[3][idx])
+        else:
+            # Values for ranking (flexible field access - case-insensitive)
+            primary_val = primary_vals[idx] if primary_vals else 0
+            secondary_val = secondary_vals[idx] if secondary_vals else 0
+            tertiary_val = tertiary_vals[idx] if tertiary_vals else 0
+
+            # Normalize scores (0-1 scale) - only for items that have the field
+            primary_score = primary_val / max_primary if max_primary > 0 else 0
+            secondary_score = secondary_val / max_secondary if max_secondary > 0 else 0
+            tertiary_score = tertiary_val / max_tertiary if max_tertiary > 0 else 0
+
+            # Weighted score for ranking criteria
+            criteria_score = (
+                primary_score * 0.5 +
+                secondary_score * 0.3 +
+                tertiary_score * 0.2
+            )
         
         ranked.append({
             'item_id': eval_item.get('item_id', candidate.get('id', '')),
@@ -137,6 +200,7 @@ def rank_and_select_with_rules(
             'metrics': candidate,
             'filters_passed_count': filters_passed,
             'total_filters': total_filters,
+            'passed_all': int(filters_passed == total_filters),
             'filter_results': eval_item.get('filter_results', {}),
             'score_breakdown': {
                 f'{primary}_score': round(primary_score, 2),
@@ -148,22 +212,25 @@ def rank_and_select_with_rules(
         })
     
     # Sort by: (1) filters_passed_count (desc), (2) then by criteria_score (desc)
-    # Items that pass all filters are ranked first
-    ranked.sort(key=lambda x: (
-        x['filters_passed_count'] == x['total_filters'],  # True (1) for all passed, False (0) otherwise
-        x['filters_passed_count'],  # Then by number of filters passed
-        x['criteria_score']  # Then by criteria score
-    ), reverse=True)
+    # Items that pass all filters are ranked first. With top_k, a heap-based
+    # partial sort avoids ordering candidates that are never surfaced.
+    if top_k is not None:
+        ranked = heapq.nlargest(top_k, ranked, key=_rank_key)
+    else:
+        ranked.sort(key=_rank_key, reverse=True)
     
-    # Add rank numbers
+    # Add rank numbers and index by item id for O(1) consumer lookups
+    ranked_by_id = {}
     for i, item in enumerate(ranked):
         item['rank'] = i + 1
-    
+        ranked_by_id[item['item_id']] = item
+
     selected = ranked[0] if ranked else None
-    
+
     if not selected:
         return {
             'ranked_candidates': [],
+            'ranked_by_id': {},
             'selection': {},
             'selected_item': None,
             'ranking_criteria': ranking_criteria
@@ -181,6 +248,7 @@ def rank_and_select_with_rules(
     
     return {
         'ranked_candidates': ranked,
+        'ranked_by_id': ranked_by_id,
         'selection': {
             'item_id': selected['item_id'],
             'item_name': selected['item_name'],
@@ -195,15 +263,38 @@ def rank_and_select_with_rules(
     }
 
 
-def _get_field_value_case_insensitive(data: Dict[str, Any], field_name: str, default: Any = None) -> Any:
-    """Get field value with case-insensitive matching."""
+def _build_lower_key_map(data: Dict[str, Any]) -> Dict[str, str]:
+    """Build a lowercase -> actual key index for case-insensitive lookups."""
+    return {key.lower(): key for key in data}
+
+
+def _get_field_value_case_insensitive(
+    data: Dict[str, Any],
+    field_name: str,
+    default: Any = None,
+    key_map: Optional[Dict[str, str]] = None
+) -> Any:
+    """
+    Get field value with case-insensitive matching.
+
+    An optional key_map (from _build_lower_key_map) resolves the field in
+    O(1); rows whose keys differ from the mapped item fall back to a scan.
+    """
     if not field_name:
         return default
-    
+
     field_lower = field_name.lower()
+
+    if key_map is not None:
+        key = key_map.get(field_lower)
+        if key is not None and key in data:
+            return data[key]
+        if field_lower in data:
+            return data[field_lower]
+
     for key in data.keys():
         if key.lower() == field_lower:
             return data.get(key, default)
-    
+
     return default
 
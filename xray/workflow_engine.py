@@ -3,10 +3,43 @@ Generic Workflow Execution Engine
 Executes user-defined workflows on any dataset without hardcoded logic.
 """
 
+import heapq
+import json
+import operator as _operator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from xray import XRay
 from xray.storage_sqlite import SQLiteStorage
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this many rows the DataFrame construction costs more than the
+# per-row Python loop it replaces
+_VECTORIZE_MIN_ROWS = 200
+
+# Operators whose column-wise pandas evaluation matches the per-row
+# semantics exactly on numeric columns
+_VECTORIZABLE_OPERATORS = {">", ">=", "<", "<=", "==", "!="}
+
+# Comparison operators shared by the compiled predicates
+_COMPARE_OPS = {">": _operator.gt, ">=": _operator.ge, "<": _operator.lt, "<=": _operator.le}
+
+# Filter steps on datasets at least this large are split into chunks and
+# evaluated on a thread pool
+_PARALLEL_MIN_ROWS = 50_000
+_PARALLEL_CHUNK_ROWS = 10_000
+
 
 class GenericWorkflowEngine:
     """
@@ -74,6 +107,9 @@ class GenericWorkflowEngine:
         workflow_id = workflow_definition.get("workflow_id", "generic_workflow")
         workflow_name = workflow_definition.get("name", "Generic Workflow")
         steps = workflow_definition.get("steps", [])
+        # Per-row evaluation dicts dominate memory on large datasets;
+        # definitions that only need counts can turn them off
+        emit_evaluations = workflow_definition.get("emit_evaluations", True)
         
         with XRay(storage=self.storage, name=execution_name or workflow_name) as xray:
             xray.add_metadata("workflow_id", workflow_id)
@@ -81,10 +117,30 @@ class GenericWorkflowEngine:
             xray.add_metadata("dataset_size", len(dataset))
             xray.add_metadata("workflow_definition", workflow_definition)
             
-            # Track data through pipeline
-            current_data = dataset.copy()
+            # Track data through pipeline. Steps never mutate their input
+            # list (filters/rankings build new lists, transformations pass
+            # through), so the caller's list is referenced directly instead
+            # of shallow-copied up front
+            current_data = dataset
             
-            for step_def in steps:
+            step_index = 0
+            while step_index < len(steps):
+                step_def = steps[step_index]
+
+                # Fuse maximal runs of consecutive filter steps into one
+                # traversal; the chunked parallel path is kept for very
+                # large datasets, which fusion does not split
+                if step_def.get("type", "filter") == "filter" and len(current_data) < _PARALLEL_MIN_ROWS:
+                    run_end = step_index + 1
+                    while run_end < len(steps) and steps[run_end].get("type", "filter") == "filter":
+                        run_end += 1
+                    if run_end - step_index > 1:
+                        current_data = self._execute_fused_filter_steps(
+                            xray, steps[step_index:run_end], current_data, emit_evaluations
+                        )
+                        step_index = run_end
+                        continue
+
                 step_id = step_def.get("id", f"step_{len(xray.steps) + 1}")
                 step_type = step_def.get("type", "filter")
                 step_label = step_def.get("label", step_id)
@@ -98,7 +154,8 @@ class GenericWorkflowEngine:
                         step_label=step_label,
                         data=current_data,
                         input_fields=input_fields,
-                        rule=rule
+                        rule=rule,
+                        emit_evaluations=emit_evaluations
                     )
                 elif step_type == "ranking":
                     result = self._execute_ranking_step(
@@ -106,7 +163,8 @@ class GenericWorkflowEngine:
                         step_label=step_label,
                         data=current_data,
                         input_fields=input_fields,
-                        rule=rule
+                        rule=rule,
+                        emit_evaluations=emit_evaluations
                     )
                 elif step_type == "transformation":
                     result = self._execute_transformation_step(
@@ -129,13 +187,9 @@ class GenericWorkflowEngine:
                 output_data = result.get("output", {})
                 reasoning = result.get("reasoning", f"Executed {step_label}")
                 
-                # Convert rule to canonical format
-                canonical_rules = [{
-                    "name": step_label,
-                    "type": step_type,
-                    "value": rule,
-                    "source": "workflow_definition"
-                }]
+                # Convert rule to canonical format (interned: identical
+                # steps across runs share one payload dict)
+                canonical_rules = [_intern_rule(step_label, step_type, rule)]
                 
                 xray.record_step(
                     step_name=step_id,
@@ -153,6 +207,7 @@ class GenericWorkflowEngine:
                 
                 # Update current data for next step
                 current_data = result.get("data", current_data)
+                step_index += 1
             
             return xray.execution_id
     
@@ -162,78 +217,51 @@ class GenericWorkflowEngine:
         step_label: str,
         data: List[Dict[str, Any]],
         input_fields: List[str],
-        rule: Dict[str, Any]
+        rule: Dict[str, Any],
+        emit_evaluations: bool = True
     ) -> Dict[str, Any]:
         """Execute a filter step."""
         operator = rule.get("operator", "==")
         value = rule.get("value")
-        
-        passed = []
-        failed = []
-        evaluations = []
-        
-        for row in data:
-            # Get entity ID (use first field or generate)
-            entity_id = row.get("id") or row.get("_id") or str(hash(str(row)))
-            
-            # Evaluate rule on input fields
-            field_values = {}
-            all_passed = True
-            checks = []
-            
-            for field in input_fields:
-                # Case-insensitive field matching
-                field_lower = field.lower()
-                matched_field = None
-                for key in row.keys():
-                    if key.lower() == field_lower:
-                        matched_field = key
-                        break
-                
-                if not matched_field:
-                    all_passed = False
-                    checks.append({
-                        "rule": f"{field} {operator} {value}",
-                        "passed": False,
-                        "expected": f"{field} should be {operator} {value}",
-                        "actual": f"Field '{field}' not found",
-                        "reason": f"Field '{field}' does not exist in row"
-                    })
-                    continue
-                
-                field_value = row[matched_field]
-                field_values[field] = field_value
-                
-                # Evaluate condition
-                passed_check = self._evaluate_condition(field_value, operator, value)
-                
-                checks.append({
-                    "rule": f"{field} {operator} {value}",
-                    "passed": passed_check,
-                    "expected": f"{field} should be {operator} {value}",
-                    "actual": str(field_value),
-                    "reason": "Passed" if passed_check else f"Value {field_value} does not satisfy {operator} {value}"
-                })
-                
-                if not passed_check:
-                    all_passed = False
-            
-            # Create evaluation
-            evaluation = {
-                "entity_id": entity_id,
-                "attributes": {k: v for k, v in row.items() if k not in ["id", "_id"]},
-                "checks": checks,
-                "final_decision": "accepted" if all_passed else "rejected"
-            }
-            evaluations.append(evaluation)
-            
-            if all_passed:
-                passed.append(row)
-            else:
-                failed.append(row)
-        
+
+        # Column-wise masks for large numeric batches; None falls back to
+        # per-row evaluation below
+        field_masks = self._vectorized_field_masks(data, input_fields, operator, value)
+
+        # Resolve field names against the schema once instead of per row
+        field_map = self._build_field_map(data, input_fields)
+
+        # One specialized closure replaces the operator dispatch chain in
+        # the row loop
+        predicate = self._compile_predicate(operator, value)
+
+        if len(data) >= _PARALLEL_MIN_ROWS:
+            passed = []
+            failed = []
+            evaluations = []
+            with ThreadPoolExecutor() as pool:
+                chunk_results = pool.map(
+                    lambda start: self._filter_chunk(
+                        data[start:start + _PARALLEL_CHUNK_ROWS], start,
+                        input_fields, operator, value,
+                        field_masks, field_map, predicate, emit_evaluations
+                    ),
+                    range(0, len(data), _PARALLEL_CHUNK_ROWS)
+                )
+                # pool.map preserves chunk order, so concatenation keeps
+                # results aligned with the input
+                for chunk_passed, chunk_failed, chunk_evals in chunk_results:
+                    passed.extend(chunk_passed)
+                    failed.extend(chunk_failed)
+                    evaluations.extend(chunk_evals)
+        else:
+            passed, failed, evaluations = self._filter_chunk(
+                data, 0, input_fields, operator, value,
+                field_masks, field_map, predicate, emit_evaluations
+            )
+
         reasoning = f"{step_label}: {len(passed)} passed, {len(failed)} failed out of {len(data)} total"
-        
+
         return {
             "data": passed,
             "evaluations": evaluations,
@@ -244,14 +272,212 @@ class GenericWorkflowEngine:
             },
             "reasoning": reasoning
         }
-    
+
+    def _filter_chunk(
+        self,
+        rows: List[Dict[str, Any]],
+        index_offset: int,
+        input_fields: List[str],
+        operator: str,
+        value: Any,
+        field_masks: Optional[Dict[str, Any]],
+        field_map: Dict[str, Optional[str]],
+        predicate,
+        emit_evaluations: bool = True
+    ) -> tuple:
+        """Evaluate one slice of a filter step's rows."""
+        passed = []
+        failed = []
+        evaluations = []
+
+        for row_index, row in enumerate(rows, index_offset):
+            # Get entity ID (stable positional fallback; hashing the whole
+            # row repr was O(row size) and unstable across processes)
+            entity_id = row.get("id") or row.get("_id") or f"_row_{row_index}"
+
+            all_passed, checks = self._filter_row_checks(
+                row, entity_id, input_fields, operator, value,
+                field_masks, row_index, field_map, predicate
+            )
+            
+            # Create evaluation
+            if emit_evaluations:
+                attributes = {**row}
+                attributes.pop("id", None)
+                attributes.pop("_id", None)
+                evaluations.append({
+                    "entity_id": entity_id,
+                    "attributes": attributes,
+                    "checks": checks,
+                    "final_decision": "accepted" if all_passed else "rejected"
+                })
+            
+            if all_passed:
+                passed.append(row)
+            else:
+                failed.append(row)
+
+        return passed, failed, evaluations
+
+    def _filter_row_checks(
+        self,
+        row: Dict[str, Any],
+        entity_id: str,
+        input_fields: List[str],
+        operator: str,
+        value: Any,
+        field_masks: Optional[Dict[str, Any]],
+        mask_index: int,
+        field_map: Dict[str, Optional[str]],
+        predicate
+    ) -> tuple:
+        """Evaluate one row against a filter rule; returns (all_passed, checks)."""
+        all_passed = True
+        checks = []
+
+        for field in input_fields:
+            # Case-insensitive field matching via the per-step map
+            matched_field = self._resolve_field(row, field, field_map)
+
+            if not matched_field:
+                all_passed = False
+                checks.append({
+                    "rule": f"{field} {operator} {value}",
+                    "passed": False,
+                    "expected": f"{field} should be {operator} {value}",
+                    "actual": f"Field '{field}' not found",
+                    "reason": f"Field '{field}' does not exist in row"
+                })
+                continue
+
+            field_value = row[matched_field]
+
+            # Evaluate condition (precomputed column mask when available)
+            if field_masks is not None:
+                passed_check = bool(field_masks[field][mask_index])
+            else:
+                passed_check = predicate(field_value)
+
+            checks.append({
+                "rule": f"{field} {operator} {value}",
+                "passed": passed_check,
+                "expected": f"{field} should be {operator} {value}",
+                "actual": str(field_value),
+                "reason": "Passed" if passed_check else f"Value {field_value} does not satisfy {operator} {value}"
+            })
+
+            if not passed_check:
+                all_passed = False
+
+        return all_passed, checks
+
+    def _execute_fused_filter_steps(
+        self,
+        xray: XRay,
+        fused_defs: List[Dict[str, Any]],
+        data: List[Dict[str, Any]],
+        emit_evaluations: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a run of consecutive filter steps in one pass over the data.
+
+        Each row flows through the filters until one rejects it, so the
+        intermediate survivor lists of the step-by-step path are never
+        materialized; per-step evaluations, counts and record_step calls
+        are identical to executing the steps separately.
+        """
+        specs = []
+        for step_def in fused_defs:
+            rule = step_def.get("rule", {})
+            operator = rule.get("operator", "==")
+            value = rule.get("value")
+            input_fields = step_def.get("input_fields", [])
+            specs.append({
+                "step_def": step_def,
+                "rule": rule,
+                "operator": operator,
+                "value": value,
+                "input_fields": input_fields,
+                # Masks are aligned to the full dataset and indexed by the
+                # original row position during the traversal
+                "masks": self._vectorized_field_masks(data, input_fields, operator, value),
+                "field_map": self._build_field_map(data, input_fields),
+                "predicate": self._compile_predicate(operator, value),
+                "total": 0,
+                "passed": 0,
+                "evaluations": []
+            })
+
+        survivors = []
+        for orig_index, row in enumerate(data):
+            row_id = row.get("id") or row.get("_id")
+            alive = True
+            for spec in specs:
+                # Positional fallback ids match the index the row would
+                # have had in this step's input list
+                position = spec["total"]
+                spec["total"] = position + 1
+                entity_id = row_id or f"_row_{position}"
+
+                all_passed, checks = self._filter_row_checks(
+                    row, entity_id, spec["input_fields"], spec["operator"],
+                    spec["value"], spec["masks"], orig_index,
+                    spec["field_map"], spec["predicate"]
+                )
+
+                if emit_evaluations:
+                    attributes = {**row}
+                    attributes.pop("id", None)
+                    attributes.pop("_id", None)
+                    spec["evaluations"].append({
+                        "entity_id": entity_id,
+                        "attributes": attributes,
+                        "checks": checks,
+                        "final_decision": "accepted" if all_passed else "rejected"
+                    })
+
+                if all_passed:
+                    spec["passed"] += 1
+                else:
+                    alive = False
+                    break
+            if alive:
+                survivors.append(row)
+
+        for spec in specs:
+            step_def = spec["step_def"]
+            step_id = step_def.get("id", f"step_{len(xray.steps) + 1}")
+            step_label = step_def.get("label", step_id)
+            total = spec["total"]
+            n_passed = spec["passed"]
+            xray.record_step(
+                step_name=step_id,
+                step_type="filter",
+                input_data={
+                    "input_count": total,
+                    "input_fields": spec["input_fields"],
+                    "rule": spec["rule"]
+                },
+                rules=[_intern_rule(step_label, "filter", spec["rule"])],
+                evaluations=spec["evaluations"],
+                output_data={
+                    "total": total,
+                    "passed": n_passed,
+                    "failed": total - n_passed
+                },
+                reasoning=f"{step_label}: {n_passed} passed, {total - n_passed} failed out of {total} total"
+            )
+
+        return survivors
+
     def _execute_ranking_step(
         self,
         step_id: str,
         step_label: str,
         data: List[Dict[str, Any]],
         input_fields: List[str],
-        rule: Dict[str, Any]
+        rule: Dict[str, Any],
+        emit_evaluations: bool = True
     ) -> Dict[str, Any]:
         """Execute a ranking step."""
         order = rule.get("order", "desc")  # "asc" or "desc"
@@ -266,49 +492,75 @@ class GenericWorkflowEngine:
                 "reasoning": f"{step_label}: No ranking performed (no fields specified)"
             }
         
+        # Resolve field names against the schema once instead of per row
+        field_map = self._build_field_map(data, input_fields)
+
+        # Missing values sort last; a single sentinel object lets the score
+        # loop below tell "absent" apart from a real infinity by identity
+        missing = float('-inf') if order == "desc" else float('inf')
+
         # Sort by first field (primary), then by subsequent fields
         def sort_key(row):
             values = []
             for field in input_fields:
-                # Case-insensitive field matching
-                field_lower = field.lower()
-                matched_field = None
-                for key in row.keys():
-                    if key.lower() == field_lower:
-                        matched_field = key
-                        break
-                
+                matched_field = self._resolve_field(row, field, field_map)
                 val = row.get(matched_field) if matched_field else None
                 if val is None:
-                    val = float('-inf') if order == "desc" else float('inf')
+                    val = missing
                 values.append(val)
             return tuple(values)
-        
-        sorted_data = sorted(data, key=sort_key, reverse=(order == "desc"))
-        
-        if limit:
-            sorted_data = sorted_data[:limit]
+
+        # Large all-numeric batches sort in C via np.lexsort; mixed or
+        # non-numeric columns fall back to the tuple path below
+        keyed = None
+        if NUMPY_AVAILABLE and len(data) >= _VECTORIZE_MIN_ROWS:
+            keyed = self._lexsort_ranking(data, input_fields, field_map, order, missing, limit)
+
+        if keyed is None:
+            # Decorate each row with its key tuple once; the tuples drive
+            # the sort and are reused for the per-rank scores below, so
+            # fields are resolved exactly once per row instead of twice
+            keyed = [(sort_key(row), row) for row in data]
+            key_of = _operator.itemgetter(0)
+
+            # When only a small head of a large dataset survives the
+            # limit, a heap partial sort (O(N log K)) beats ordering
+            # everything; both heapq selectors match the stable
+            # sorted()[:limit] result
+            if limit and limit * 10 < len(keyed):
+                if order == "desc":
+                    keyed = heapq.nlargest(limit, keyed, key=key_of)
+                else:
+                    keyed = heapq.nsmallest(limit, keyed, key=key_of)
+            else:
+                keyed.sort(key=key_of, reverse=(order == "desc"))
+                if limit:
+                    keyed = keyed[:limit]
+        sorted_data = [row for _key, row in keyed]
         
         # Create evaluations with rankings
         evaluations = []
-        for rank, row in enumerate(sorted_data, 1):
-            entity_id = row.get("id") or row.get("_id") or str(hash(str(row)))
+        for rank, (key_values, row) in enumerate(keyed, 1) if emit_evaluations else ():
+            entity_id = row.get("id") or row.get("_id") or f"_row_{rank - 1}"
             
-            # Calculate score based on ranking fields (case-insensitive)
+            # Calculate score from the already-resolved key tuple; EAFP
+            # addition skips non-numeric values without a per-value
+            # isinstance check
             score = 0
-            for field in input_fields:
-                field_lower = field.lower()
-                matched_field = None
-                for key in row.keys():
-                    if key.lower() == field_lower:
-                        matched_field = key
-                        break
-                if matched_field and isinstance(row.get(matched_field), (int, float)):
-                    score += row.get(matched_field, 0)
+            for val in key_values:
+                if val is missing:
+                    continue
+                try:
+                    score += val
+                except TypeError:
+                    pass
             
+            attributes = {**row}
+            attributes.pop("id", None)
+            attributes.pop("_id", None)
             evaluations.append({
                 "entity_id": entity_id,
-                "attributes": {k: v for k, v in row.items() if k not in ["id", "_id"]},
+                "attributes": attributes,
                 "checks": [{
                     "rule": f"Rank by {', '.join(input_fields)} ({order})",
                     "passed": True,
@@ -332,6 +584,56 @@ class GenericWorkflowEngine:
             "reasoning": reasoning
         }
     
+    def _lexsort_ranking(
+        self,
+        data: List[Dict[str, Any]],
+        input_fields: List[str],
+        field_map: Dict[str, Optional[str]],
+        order: str,
+        missing: float,
+        limit: Optional[int]
+    ) -> Optional[List[tuple]]:
+        """
+        Rank purely numeric columns with np.lexsort.
+
+        Returns the ordered (key_tuple, row) list (already limited), or
+        None when any value is non-numeric or NaN so the caller keeps the
+        exact Python tuple sort. Negating the key arrays for descending
+        order preserves the stable tie order of sorted(reverse=True).
+        """
+        try:
+            columns = []
+            for field in input_fields:
+                column = []
+                column_append = column.append
+                for row in data:
+                    matched_field = self._resolve_field(row, field, field_map)
+                    val = row.get(matched_field) if matched_field else None
+                    if val is None:
+                        val = missing
+                    elif not isinstance(val, (int, float)) or val != val:
+                        return None
+                    column_append(val)
+                columns.append(column)
+
+            # lexsort treats its last key as primary, so feed the fields
+            # in reverse
+            arrays = [np.asarray(column, dtype=float) for column in reversed(columns)]
+            if order == "desc":
+                perm = np.lexsort([-arr for arr in arrays])
+            else:
+                perm = np.lexsort(arrays)
+            indices = perm[:limit] if limit else perm
+
+            # Key tuples keep the original Python values (and the missing
+            # sentinel), so downstream scores are unchanged
+            return [
+                (tuple(column[i] for column in columns), data[i])
+                for i in indices
+            ]
+        except (TypeError, ValueError):
+            return None
+
     def _execute_transformation_step(
         self,
         step_id: str,
@@ -349,75 +651,335 @@ class GenericWorkflowEngine:
             "reasoning": f"{step_label}: Processed {len(data)} items"
         }
     
+    @staticmethod
+    def _compile_predicate(operator: str, expected: Any):
+        """
+        Specialize the condition check for one (operator, expected) pair.
+
+        The expected-side normalization (strip/lower, list lowering) runs
+        once here instead of per row, and the returned closure skips the
+        operator dispatch chain entirely. Semantics match
+        _evaluate_condition_impl.
+        """
+        expected_is_str = isinstance(expected, str)
+        expected_str = str(expected).strip() if expected_is_str else expected
+        # The string-comparison branches always compare against this form
+        exp_cmp = str(expected_str).lower()
+
+        if operator == "==":
+            def predicate(v):
+                try:
+                    if expected_is_str or isinstance(v, str):
+                        vs = str(v).strip() if isinstance(v, str) else v
+                        return str(vs).lower() == exp_cmp
+                    return v == expected
+                except (TypeError, ValueError):
+                    return False
+        elif operator == "!=":
+            def predicate(v):
+                try:
+                    if expected_is_str or isinstance(v, str):
+                        vs = str(v).strip() if isinstance(v, str) else v
+                        return str(vs).lower() != exp_cmp
+                    return v != expected
+                except (TypeError, ValueError):
+                    return False
+        elif operator == "contains":
+            def predicate(v):
+                try:
+                    vs = str(v).strip() if isinstance(v, str) else v
+                    return exp_cmp in str(vs).lower()
+                except (TypeError, ValueError):
+                    return False
+        elif operator == "not_contains":
+            def predicate(v):
+                try:
+                    vs = str(v).strip() if isinstance(v, str) else v
+                    return exp_cmp not in str(vs).lower()
+                except (TypeError, ValueError):
+                    return False
+        elif operator == "starts_with":
+            def predicate(v):
+                try:
+                    vs = str(v).strip() if isinstance(v, str) else v
+                    return str(vs).lower().startswith(exp_cmp)
+                except (TypeError, ValueError):
+                    return False
+        elif operator == "ends_with":
+            def predicate(v):
+                try:
+                    vs = str(v).strip() if isinstance(v, str) else v
+                    return str(vs).lower().endswith(exp_cmp)
+                except (TypeError, ValueError):
+                    return False
+        elif operator in ("in", "not_in"):
+            is_listlike = isinstance(expected, (list, tuple))
+            lowered = [str(e).lower() for e in expected] if is_listlike else []
+            # Unhashable members (e.g. nested lists) keep membership on the
+            # original sequence instead of crashing the compile
+            try:
+                member_set = set(expected) if is_listlike else set()
+            except TypeError:
+                member_set = None
+            negate = operator == "not_in"
+
+            def predicate(v):
+                try:
+                    if not is_listlike:
+                        return negate
+                    if isinstance(v, str):
+                        result = str(v).strip().lower() in lowered
+                    elif member_set is None:
+                        result = v in expected
+                    else:
+                        try:
+                            result = v in member_set
+                        except TypeError:
+                            result = v in expected
+                    return (not result) if negate else result
+                except (TypeError, ValueError):
+                    return False
+        elif operator in (">", ">=", "<", "<="):
+            compare = _COMPARE_OPS[operator]
+
+            def predicate(v):
+                try:
+                    if expected_is_str or isinstance(v, str):
+                        # Case-insensitive lexicographic comparison for strings
+                        vs = str(v).strip() if isinstance(v, str) else v
+                        return compare(str(vs).lower(), exp_cmp)
+                    return compare(v, expected)
+                except (TypeError, ValueError):
+                    return False
+        else:
+            def predicate(v):
+                return False
+
+        return predicate
+
+    @staticmethod
+    def _build_field_map(
+        data: List[Dict[str, Any]],
+        input_fields: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve each input field to its actual dict key once per step.
+
+        Uses the first row as the schema sample; heterogeneous rows fall
+        back to a per-row scan at the call sites.
+        """
+        if not data:
+            return {field: None for field in input_fields}
+        lower_to_actual = {key.lower(): key for key in data[0].keys()}
+        return {field: lower_to_actual.get(field.lower()) for field in input_fields}
+
+    @staticmethod
+    def _resolve_field(row: Dict[str, Any], field: str, field_map: Dict[str, Optional[str]]) -> Optional[str]:
+        """Look up a row's key for a field, scanning only on a map miss."""
+        matched_field = field_map.get(field)
+        if matched_field is not None and matched_field in row:
+            return matched_field
+
+        field_lower = field.lower()
+        for key in row.keys():
+            if key.lower() == field_lower:
+                return key
+        return None
+
+    def _vectorized_field_masks(
+        self,
+        data: List[Dict[str, Any]],
+        input_fields: List[str],
+        operator: str,
+        value: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate a numeric filter column-wise with pandas.
+
+        Returns a field -> boolean-array mapping, or None when the batch is
+        small, pandas is missing, or the rule/columns are not purely numeric
+        (those cases keep the exact per-row path).
+        """
+        if not PANDAS_AVAILABLE or len(data) < _VECTORIZE_MIN_ROWS:
+            return None
+        if operator not in _VECTORIZABLE_OPERATORS:
+            return None
+        # Strings and bools take the per-row comparison semantics
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+
+        try:
+            df = pd.DataFrame(data)
+
+            # Case-insensitive column resolution; bail out on ambiguous
+            # casing so per-row matching stays authoritative
+            columns_by_lower: Dict[str, list] = {}
+            for column in df.columns:
+                columns_by_lower.setdefault(str(column).lower(), []).append(column)
+
+            masks = {}
+            for field in input_fields:
+                variants = columns_by_lower.get(field.lower(), [])
+                if len(variants) != 1:
+                    return None
+                column = df[variants[0]]
+                if column.dtype.kind not in 'ifb':
+                    return None
+
+                if operator == ">":
+                    mask = column.gt(value)
+                elif operator == ">=":
+                    mask = column.ge(value)
+                elif operator == "<":
+                    mask = column.lt(value)
+                elif operator == "<=":
+                    mask = column.le(value)
+                elif operator == "==":
+                    mask = column.eq(value)
+                else:
+                    mask = column.ne(value)
+                masks[field] = mask.to_numpy()
+            return masks
+        except Exception as e:
+            print(f"Warning: vectorized filter evaluation failed, using row-wise path: {e}")
+            return None
+
     def _evaluate_condition(self, value: Any, operator: str, expected: Any) -> bool:
-        """Evaluate a condition with proper type handling."""
+        """
+        Evaluate a condition with proper type handling.
+
+        Hashable inputs go through a memoized evaluator, so datasets with
+        heavily repeated values (e.g. category == "books" over 10k rows)
+        pay the string normalization once per distinct tuple.
+        """
+        try:
+            return _evaluate_condition_cached(type(value), value, operator,
+                                              type(expected), expected)
+        except TypeError:
+            # Unhashable value/expected (lists, dicts) - evaluate directly
+            return self._evaluate_condition_impl(value, operator, expected)
+
+    @staticmethod
+    def _evaluate_condition_impl(value: Any, operator: str, expected: Any) -> bool:
+        """Uncached condition evaluation."""
         try:
-            # Convert both to strings for comparison if either is a string
-            value_str = str(value).strip() if isinstance(value, str) else value
-            expected_str = str(expected).strip() if isinstance(expected, str) else expected
-            
             # Determine if we're comparing strings
             is_string_comparison = isinstance(value, str) or isinstance(expected, str)
-            
+
+            # Normalize each side exactly once per call; the old
+            # branch-local str(...).lower() chains allocated a fresh
+            # string per use
+            if is_string_comparison:
+                value_cmp = (value.strip() if isinstance(value, str) else str(value)).lower()
+                expected_cmp = (expected.strip() if isinstance(expected, str) else str(expected)).lower()
+            elif operator in ("contains", "not_contains", "starts_with", "ends_with"):
+                # Substring operators compare textually even for
+                # non-string operands
+                value_cmp = str(value).lower()
+                expected_cmp = str(expected).lower()
+
             if operator == "==":
                 if is_string_comparison:
                     # Case-insensitive string equality
-                    return str(value_str).lower() == str(expected_str).lower()
+                    return value_cmp == expected_cmp
                 return value == expected
             elif operator == "!=":
                 if is_string_comparison:
-                    return str(value_str).lower() != str(expected_str).lower()
+                    return value_cmp != expected_cmp
                 return value != expected
             elif operator == "contains":
                 # String contains (case-insensitive)
-                return str(expected_str).lower() in str(value_str).lower()
+                return expected_cmp in value_cmp
             elif operator == "not_contains":
                 # String does not contain (case-insensitive)
-                return str(expected_str).lower() not in str(value_str).lower()
+                return expected_cmp not in value_cmp
             elif operator == "starts_with":
                 # String starts with (case-insensitive)
-                return str(value_str).lower().startswith(str(expected_str).lower())
+                return value_cmp.startswith(expected_cmp)
             elif operator == "ends_with":
                 # String ends with (case-insensitive)
-                return str(value_str).lower().endswith(str(expected_str).lower())
+                return value_cmp.endswith(expected_cmp)
             elif operator == "in":
                 # Value in list
                 if isinstance(expected, (list, tuple)):
                     if is_string_comparison:
-                        return str(value_str).lower() in [str(e).lower() for e in expected]
+                        return value_cmp in [str(e).lower() for e in expected]
                     return value in expected
                 return False
             elif operator == "not_in":
                 # Value not in list
                 if isinstance(expected, (list, tuple)):
                     if is_string_comparison:
-                        return str(value_str).lower() not in [str(e).lower() for e in expected]
+                        return value_cmp not in [str(e).lower() for e in expected]
                     return value not in expected
                 return True
             elif operator == ">":
                 # Numeric comparison only
                 if is_string_comparison:
                     # For strings, use case-insensitive lexicographic comparison
-                    return str(value_str).lower() > str(expected_str).lower()
+                    return value_cmp > expected_cmp
                 return value > expected
             elif operator == ">=":
                 # Numeric comparison only
                 if is_string_comparison:
-                    # For strings, use case-insensitive lexicographic comparison
-                    return str(value_str).lower() >= str(expected_str).lower()
+                    return value_cmp >= expected_cmp
                 return value >= expected
             elif operator == "<":
                 if is_string_comparison:
-                    # For strings, use case-insensitive lexicographic comparison
-                    return str(value_str).lower() < str(expected_str).lower()
+                    return value_cmp < expected_cmp
                 return value < expected
             elif operator == "<=":
                 if is_string_comparison:
-                    # For strings, use case-insensitive lexicographic comparison
-                    return str(value_str).lower() <= str(expected_str).lower()
+                    return value_cmp <= expected_cmp
                 return value <= expected
             else:
                 return False
         except (TypeError, ValueError):
             return False
 
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_condition_cached(value_type: type, value: Any, operator: str,
+                               expected_type: type, expected: Any) -> bool:
+    """
+    Memoized condition evaluation for hashable inputs.
+
+    The operand types are part of the key because equal-hashing values of
+    different types (1, 1.0, True) stringify differently for the substring
+    operators and must not share a cache entry.
+    """
+    return GenericWorkflowEngine._evaluate_condition_impl(value, operator, expected)
+
+
+# Canonical-rule payloads keyed by their sorted JSON; long pipelines with
+# repeated rule shapes then pass one shared dict to record_step instead of
+# allocating an identical literal per step
+_RULE_INTERN_CACHE: Dict[str, Dict[str, Any]] = {}
+_RULE_INTERN_MAX = 256
+
+
+def _intern_rule(step_label: str, step_type: str, rule: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shared canonical-rule dict for this (label, type, rule)."""
+    try:
+        cache_key = json.dumps((step_label, step_type, rule), sort_keys=True)
+    except (TypeError, ValueError):
+        # Non-serializable rule - fall back to a fresh payload
+        return {
+            "name": step_label,
+            "type": step_type,
+            "value": rule,
+            "source": "workflow_definition"
+        }
+
+    interned = _RULE_INTERN_CACHE.get(cache_key)
+    if interned is None:
+        if len(_RULE_INTERN_CACHE) >= _RULE_INTERN_MAX:
+            _RULE_INTERN_CACHE.clear()
+        interned = _RULE_INTERN_CACHE[cache_key] = {
+            "name": step_label,
+            "type": step_type,
+            "value": rule,
+            "source": "workflow_definition"
+        }
+    return interned